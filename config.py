@@ -1,10 +1,27 @@
 # --- Video Source ---
 VIDEO_SOURCE = 0  # 0 for webcam, or "path/to/your_cctv_feed.mp4"
+USE_GSTREAMER_DECODE = True  # Decode files/streams via GStreamer (hardware decoders) when OpenCV supports it
 
 # --- Model ---
 # We'll use the COCO model to auto-detect objects
 MODEL_PATH = "yolov8n.pt" 
 
+# --- Inference ---
+USE_TENSORRT = False  # Export/load a TensorRT FP16 engine when a CUDA GPU is available (first run exports for minutes, blocking startup)
+USE_OPENVINO_INT8 = False  # Without a GPU, export/load an INT8 OpenVINO model (needs openvino; calibrates on coco128 once)
+INFERENCE_SIZE = 640  # Fixed model input size in pixels (TensorRT engines need a static shape)
+INFERENCE_BATCH_SIZE = 4  # Max queued frames tracked per model call
+INFER_STRIDE = 1  # Run the tracker on every Nth frame; frames in between reuse the last detections (2+ trades alert latency for speed)
+ADAPTIVE_INFER_STRIDE = False  # Raise the stride (up to MAX_INFER_STRIDE) while FPS is below TARGET_FPS
+MAX_INFER_STRIDE = 4
+TARGET_FPS = 20
+
+# --- Snapshots ---
+JPEG_QUALITY = 85  # Quality for captured frames and alert snapshots (OpenCV default is 95)
+
+# --- GUI ---
+DISPLAY_FPS = 30  # Camera feed refresh rate; the video loop sleeps only for what's left of each frame's budget
+
 # --- Alert Logic ---
 # How many frames must the object be missing before we alert?
 ALERT_THRESHOLD = 25
@@ -12,4 +29,6 @@ ALERT_THRESHOLD = 25
 # --- Email Alert Configuration ---
 EMAIL_ALERTS_ENABLED = True  # Set to False to disable email alerts
 EMAIL_ALERT_COOLDOWN = 300  # Seconds between emails (300 = 5 minutes)
-EMAIL_INCLUDE_IMAGE = True  # Attach alert snapshot to email
\ No newline at end of file
+EMAIL_INCLUDE_IMAGE = True  # Attach alert snapshot to email
+EMAIL_MAX_IMAGE_BYTES = 2_000_000  # Larger snapshots are re-encoded before attaching
+EMAIL_IMAGE_REENCODE_QUALITY = 70  # JPEG quality for that re-encode
\ No newline at end of file
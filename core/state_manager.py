@@ -1,40 +1,76 @@
 class StateManager:
     """Manages the surveillance state and handles the alert counter."""
-    
+
+    # States are stored as small ints; STATE_NAMES maps them back to labels
+    INITIALIZING, SECURED, ALERT = range(3)
+    STATE_NAMES = ("INITIALIZING", "SECURED", "ALERT")
+
     def __init__(self, alert_threshold):
-        self.state = "INITIALIZING"
-        self.alert_threshold = alert_threshold
+        # alert_threshold is an int, or a one-item list shared with other
+        # managers (the engine's) so one write updates all of them
+        if not isinstance(alert_threshold, list):
+            alert_threshold = [alert_threshold]
+        self._threshold_ref = alert_threshold
+        self._state = self.INITIALIZING
         self.missing_counter = 0
+
+        # Per-state update function, swapped on every transition so each
+        # frame runs only the current state's logic
+        self._tick = self._tick_initializing
         print("State Manager initialized.")
-        print(f"Alert threshold set to {alert_threshold} frames.")
+        print(f"Alert threshold set to {self.alert_threshold} frames.")
+
+    @property
+    def alert_threshold(self):
+        return self._threshold_ref[0]
+
+    @alert_threshold.setter
+    def alert_threshold(self, threshold):
+        self._threshold_ref[0] = threshold
+
+    @property
+    def state(self):
+        return self.STATE_NAMES[self._state]
+
+    def _enter_secured(self):
+        self._state = self.SECURED
+        self._tick = self._tick_secured
+        self.missing_counter = 0
+
+    def _tick_initializing(self, object_present):
+        if object_present:
+            self._enter_secured()
+            print("State changed to SECURED.")
+            return "SECURED"
+        return "INITIALIZING"
+
+    def _tick_secured(self, object_present):
+        if object_present:
+            self.missing_counter = 0 # Reset counter if object reappears
+            return "SECURED"
+
+        self.missing_counter += 1
+        if self.missing_counter > self._threshold_ref[0]:
+            self._state = self.ALERT
+            self._tick = self._tick_alert
+            print(f"State changed to ALERT! Object missing for {self.missing_counter} frames.")
+            return "ALERT"
+        return "SECURED"
+
+    def _tick_alert(self, object_present):
+        if object_present:
+            # Object has returned
+            self._enter_secured()
+            print("State changed back to SECURED. Object has returned.")
+            return "SECURED"
+        return "ALERT"
 
     def update_status(self, object_present):
         """
         Updates the state based on whether the object is present.
         Returns the current state.
         """
-        if self.state == "INITIALIZING" and object_present:
-            self.state = "SECURED"
-            self.missing_counter = 0
-            print("State changed to SECURED.")
-
-        elif self.state == "SECURED":
-            if not object_present:
-                self.missing_counter += 1
-                if self.missing_counter > self.alert_threshold:
-                    self.state = "ALERT"
-                    print(f"State changed to ALERT! Object missing for {self.missing_counter} frames.")
-            else:
-                self.missing_counter = 0 # Reset counter if object reappears
-
-        elif self.state == "ALERT":
-            if object_present:
-                # Object has returned
-                self.state = "SECURED"
-                self.missing_counter = 0
-                print("State changed back to SECURED. Object has returned.")
-        
-        return self.state
+        return self._tick(object_present)
 
     def get_state(self):
-        return self.state
\ No newline at end of file
+        return self.state
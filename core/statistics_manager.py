@@ -2,31 +2,151 @@
 Statistics Manager - Track and analyze surveillance system performance
 """
 
-import pandas as pd
+import numpy as np
+import bisect
+import csv
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-from collections import defaultdict
+from typing import List, Dict, Optional, Tuple
+from collections import Counter, defaultdict, deque
+
+
+# Telemetry timestamps (objects tracked) don't need sub-second accuracy,
+# so they share a wall-clock reading refreshed at most every 250 ms
+_COARSE_CLOCK_RESOLUTION = 0.25
+_coarse_clock = [0.0, None]  # [monotonic time of last refresh, datetime]
+
+
+def _coarse_now() -> datetime:
+    """Return a cached datetime.now(), at most _COARSE_CLOCK_RESOLUTION seconds old"""
+    tick = time.monotonic()
+    if _coarse_clock[1] is None or tick - _coarse_clock[0] >= _COARSE_CLOCK_RESOLUTION:
+        _coarse_clock[0] = tick
+        _coarse_clock[1] = datetime.now()
+    return _coarse_clock[1]
+
+
+def _format_uptime(seconds: float) -> str:
+    """Format seconds like str(timedelta) without the microseconds part"""
+    days, rem = divmod(int(seconds), 86400)
+    hours, rem = divmod(rem, 3600)
+    minutes, secs = divmod(rem, 60)
+    clock = f"{hours}:{minutes:02d}:{secs:02d}"
+    if days:
+        return f"{days} day{'s' if days != 1 else ''}, {clock}"
+    return clock
+
+
+class _RollingStats:
+    """Running sum/min/max over a fixed-size window of samples"""
+    
+    def __init__(self, size: int):
+        self.size = size
+        self.reset()
+    
+    def reset(self):
+        """Forget all samples"""
+        self.total = 0.0
+        self.count = 0
+        self._seq = 0
+        # Monotonic deques of (seq, value) for sliding-window min/max
+        self._min_window = deque()
+        self._max_window = deque()
+    
+    def add(self, value: float, evicted: Optional[float] = None):
+        """Add a sample; pass the value that fell out of the window, if any"""
+        if evicted is not None:
+            self.total -= evicted
+            self.count -= 1
+        self.total += value
+        self.count += 1
+        
+        seq = self._seq
+        self._seq += 1
+        oldest = seq - self.size
+        
+        while self._min_window and self._min_window[-1][1] >= value:
+            self._min_window.pop()
+        self._min_window.append((seq, value))
+        if self._min_window[0][0] <= oldest:
+            self._min_window.popleft()
+        
+        while self._max_window and self._max_window[-1][1] <= value:
+            self._max_window.pop()
+        self._max_window.append((seq, value))
+        if self._max_window[0][0] <= oldest:
+            self._max_window.popleft()
+    
+    @property
+    def average(self) -> float:
+        return self.total / self.count if self.count else 0.0
+    
+    @property
+    def min(self) -> float:
+        return self._min_window[0][1] if self._min_window else 0.0
+    
+    @property
+    def max(self) -> float:
+        return self._max_window[0][1] if self._max_window else 0.0
 
 
 class StatisticsManager:
-    """Manage and analyze surveillance statistics"""
+    """
+    Manage and analyze surveillance statistics
+    
+    Recording happens on the video/email threads while the dashboard reads
+    from the Tk thread, so all state is guarded by a single lock. Clock reads
+    and result formatting are kept outside it to keep the hold time short.
+    """
+    
+    # Column order used for exported alert records
+    ALERT_FIELDS = ['timestamp', 'object_name', 'object_id', 'roi_index',
+                    'confidence', 'duration_missing', 'session_id']
+    
+    # FPS ring buffer record: monotonic timestamp and sample (float64 so the
+    # value evicted from the rolling sum is exactly the one that was added)
+    FPS_DTYPE = np.dtype([('t_ns', np.int64), ('fps', np.float64)])
     
     def __init__(self):
         """Initialize statistics manager"""
+        self._lock = threading.Lock()
+        
         self.start_time = datetime.now()
+        self._start_ns = time.monotonic_ns()  # Monotonic origin for uptime/FPS timing
         self.session_id = self.start_time.strftime("%Y%m%d_%H%M%S")
         
-        # Alert tracking
-        self.alerts = []
+        # Alert tracking - stored column-wise, one list per field, in time
+        # order; aggregates are maintained as alerts are recorded
+        self._alert_timestamps = []
+        self._alert_names = []
+        self._alert_ids = []
+        self._alert_rois = []
+        self._alert_confidences = []
+        self._alert_durations = []
         self.total_alerts = 0
+        self._object_counts = Counter()
+        self._hourly_counts = [0] * 24
+        self._start_new_day(self.start_time)
+        self._alerts_df_cache = None  # (alert count, DataFrame)
         
-        # Performance tracking
-        self.fps_history = []
+        # Performance tracking (bounded ring buffers, oldest samples drop off)
         self.max_fps_samples = 1000  # Keep last 1000 samples
+        self.max_confidence_samples = 500  # Keep last 500 detections
+        
+        # FPS samples live in a preallocated structured ring buffer
+        self._fps_buffer = np.zeros(self.max_fps_samples, dtype=self.FPS_DTYPE)
+        self._fps_head = 0  # Next slot to write
+        self._fps_count = 0
         
         # Object tracking
-        self.objects_tracked_history = []
-        self.detection_confidence_history = []
+        self.objects_tracked_history = deque()  # Time-windowed (last hour)
+        self._fps_rolling = _RollingStats(self.max_fps_samples)
+        
+        # Detection confidences live in a preallocated NumPy ring buffer
+        self._confidence_buffer = np.empty(self.max_confidence_samples, dtype=np.float64)
+        self._confidence_head = 0  # Next slot to write
+        self._confidence_count = 0
         
         # Email tracking
         self.emails_sent = 0
@@ -38,185 +158,300 @@ class StatisticsManager:
                     roi_index: int = None, confidence: float = None,
                     duration_missing: int = None):
         """Record an alert event"""
-        alert_record = {
-            'timestamp': datetime.now(),
-            'object_name': object_name,
-            'object_id': object_id,
-            'roi_index': roi_index,
-            'confidence': confidence,
-            'duration_missing': duration_missing,
-            'session_id': self.session_id
-        }
-        
-        self.alerts.append(alert_record)
-        self.total_alerts += 1
+        now = datetime.now()
         
-        print(f"📊 Alert recorded: {object_name} (Total: {self.total_alerts})")
+        with self._lock:
+            self._alert_timestamps.append(now)
+            self._alert_names.append(object_name)
+            self._alert_ids.append(object_id)
+            self._alert_rois.append(roi_index)
+            self._alert_confidences.append(confidence)
+            self._alert_durations.append(duration_missing)
+            self.total_alerts += 1
+            total = self.total_alerts
+            
+            # Update aggregates
+            self._object_counts[object_name] += 1
+            self._hourly_counts[now.hour] += 1
+            if not self._today_start <= now < self._tomorrow_start:
+                self._start_new_day(now)
+            self._alerts_today_count += 1
+        
+        print(f"📊 Alert recorded: {object_name} (Total: {total})")
+    
+    def _start_new_day(self, now: datetime):
+        """Compute today's boundaries once and reset the daily alert counter"""
+        self._today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        self._tomorrow_start = self._today_start + timedelta(days=1)
+        self._alerts_today_count = 0
+    
+    def _wall_time(self, t_ns: int) -> datetime:
+        """Convert a monotonic_ns reading from this session to wall-clock time"""
+        return self.start_time + timedelta(microseconds=(t_ns - self._start_ns) / 1000)
     
     def record_fps(self, fps: float):
         """Record FPS measurement"""
-        self.fps_history.append({
-            'timestamp': datetime.now(),
-            'fps': fps
-        })
-        
-        # Keep only recent samples
-        if len(self.fps_history) > self.max_fps_samples:
-            self.fps_history.pop(0)
+        t_ns = time.monotonic_ns()
+        
+        with self._lock:
+            slot = self._fps_buffer[self._fps_head]
+            evicted = None
+            if self._fps_count == self.max_fps_samples:
+                evicted = float(slot['fps'])  # Oldest sample, about to be overwritten
+            else:
+                self._fps_count += 1
+            self._fps_rolling.add(fps, evicted)
+            slot['t_ns'] = t_ns
+            slot['fps'] = fps
+            self._fps_head = (self._fps_head + 1) % self.max_fps_samples
+    
+    @property
+    def fps_history(self) -> np.ndarray:
+        """Copy of the recorded FPS samples (FPS_DTYPE records), oldest first"""
+        with self._lock:
+            return self._fps_recent(self.max_fps_samples)
+    
+    def _fps_recent(self, samples: int) -> np.ndarray:
+        """Copy the newest FPS samples in chronological order (lock held)"""
+        count = min(samples, self._fps_count)
+        return self._fps_buffer[(self._fps_head - count + np.arange(count)) % self.max_fps_samples]
+    
+    def _fps_latest(self) -> float:
+        """Most recent FPS sample, or 0 if none (lock held)"""
+        return float(self._fps_buffer[self._fps_head - 1]['fps']) if self._fps_count else 0
     
     def record_objects_tracked(self, count: int):
         """Record number of objects currently tracked"""
-        self.objects_tracked_history.append({
-            'timestamp': datetime.now(),
-            'count': count
-        })
-        
-        # Keep only last hour
-        cutoff = datetime.now() - timedelta(hours=1)
-        self.objects_tracked_history = [
-            x for x in self.objects_tracked_history 
-            if x['timestamp'] > cutoff
-        ]
+        now = _coarse_now()
+        cutoff = now - timedelta(hours=1)
+        
+        with self._lock:
+            history = self.objects_tracked_history
+            history.append({
+                'timestamp': now,
+                'count': count
+            })
+            
+            # Keep only last hour (timestamps are monotonic, so trim from the left)
+            while history and history[0]['timestamp'] <= cutoff:
+                history.popleft()
     
     def record_detection_confidence(self, confidence: float):
         """Record detection confidence score"""
-        self.detection_confidence_history.append(confidence)
-        
-        # Keep only last 500 detections
-        if len(self.detection_confidence_history) > 500:
-            self.detection_confidence_history.pop(0)
+        with self._lock:
+            self._confidence_buffer[self._confidence_head] = confidence
+            self._confidence_head = (self._confidence_head + 1) % self.max_confidence_samples
+            if self._confidence_count < self.max_confidence_samples:
+                self._confidence_count += 1
+    
+    @property
+    def detection_confidence_history(self) -> np.ndarray:
+        """Copy of the recorded confidences, oldest first"""
+        with self._lock:
+            return self._confidence_snapshot()
+    
+    def _confidence_snapshot(self) -> np.ndarray:
+        """Copy the confidence ring buffer in chronological order (lock held)"""
+        if self._confidence_count < self.max_confidence_samples:
+            return self._confidence_buffer[:self._confidence_count].copy()
+        return np.roll(self._confidence_buffer, -self._confidence_head)
     
     def record_email_sent(self, success: bool = True):
         """Record email send attempt"""
-        if success:
-            self.emails_sent += 1
-        else:
-            self.email_failures += 1
+        with self._lock:
+            if success:
+                self.emails_sent += 1
+            else:
+                self.email_failures += 1
+    
+    @property
+    def alerts(self) -> List[Dict]:
+        """Recorded alerts as a list of dicts (built on demand)"""
+        with self._lock:
+            return list(self._iter_alert_rows())
+    
+    def _iter_alert_rows(self):
+        """Yield recorded alerts as dicts keyed by ALERT_FIELDS (lock held)"""
+        session_id = self.session_id
+        for row in zip(self._alert_timestamps, self._alert_names, self._alert_ids,
+                       self._alert_rois, self._alert_confidences, self._alert_durations):
+            yield dict(zip(self.ALERT_FIELDS, row + (session_id,)))
     
     def get_summary_stats(self) -> Dict:
         """Get summary statistics"""
         now = datetime.now()
-        uptime = now - self.start_time
-        
-        # Calculate alerts today
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        alerts_today = len([a for a in self.alerts if a['timestamp'] >= today_start])
-        
-        # Calculate average FPS
-        avg_fps = 0.0
-        if self.fps_history:
-            avg_fps = sum(x['fps'] for x in self.fps_history) / len(self.fps_history)
-        
-        # Get most common object
-        if self.alerts:
-            object_counts = defaultdict(int)
-            for alert in self.alerts:
-                object_counts[alert['object_name']] += 1
-            most_common_object = max(object_counts.items(), key=lambda x: x[1])[0]
-            most_common_count = object_counts[most_common_object]
-        else:
-            most_common_object = "None"
-            most_common_count = 0
-        
-        # Current objects tracked
-        current_objects = 0
-        if self.objects_tracked_history:
-            current_objects = self.objects_tracked_history[-1]['count']
+        uptime_seconds = (time.monotonic_ns() - self._start_ns) / 1e9
+        
+        with self._lock:
+            # Alerts today (counter resets when the date rolls over)
+            if not self._today_start <= now < self._tomorrow_start:
+                self._start_new_day(now)
+            alerts_today = self._alerts_today_count
+            
+            # Average FPS is maintained incrementally in record_fps
+            avg_fps = self._fps_rolling.average
+            current_fps = self._fps_latest()
+            
+            # Get most common object
+            if self._object_counts:
+                most_common_object, most_common_count = self._object_counts.most_common(1)[0]
+            else:
+                most_common_object = "None"
+                most_common_count = 0
+            
+            # Current objects tracked
+            current_objects = 0
+            if self.objects_tracked_history:
+                current_objects = self.objects_tracked_history[-1]['count']
+            
+            total_alerts = self.total_alerts
+            emails_sent = self.emails_sent
+            email_failures = self.email_failures
         
         return {
-            'total_alerts': self.total_alerts,
+            'total_alerts': total_alerts,
             'alerts_today': alerts_today,
-            'uptime': str(uptime).split('.')[0],  # Remove microseconds
-            'uptime_seconds': uptime.total_seconds(),
+            'uptime': _format_uptime(uptime_seconds),
+            'uptime_seconds': uptime_seconds,
             'avg_fps': round(avg_fps, 1),
-            'current_fps': round(self.fps_history[-1]['fps'], 1) if self.fps_history else 0,
+            'current_fps': round(current_fps, 1),
             'most_common_object': most_common_object,
             'most_common_count': most_common_count,
             'current_objects_tracked': current_objects,
-            'emails_sent': self.emails_sent,
-            'email_failures': self.email_failures,
+            'emails_sent': emails_sent,
+            'email_failures': email_failures,
             'session_start': self.start_time.strftime('%Y-%m-%d %H:%M:%S')
         }
     
-    def get_alerts_dataframe(self) -> pd.DataFrame:
-        """Get alerts as pandas DataFrame"""
-        if not self.alerts:
+    def get_alerts_dataframe(self) -> "pandas.DataFrame":
+        """Get alerts as pandas DataFrame (cached until a new alert is recorded)"""
+        import pandas as pd  # Deferred: only needed when a DataFrame is requested
+        
+        with self._lock:
+            count = len(self._alert_timestamps)
+            cache = self._alerts_df_cache
+            if count and cache is not None and cache[0] == count:
+                return cache[1]
+            
+            # Columns map straight onto the DataFrame without per-row dicts
+            columns = {
+                'timestamp': self._alert_timestamps[:count],
+                'object_name': self._alert_names[:count],
+                'object_id': self._alert_ids[:count],
+                'roi_index': self._alert_rois[:count],
+                'confidence': self._alert_confidences[:count],
+                'duration_missing': self._alert_durations[:count],
+                'session_id': self.session_id
+            }
+        
+        if not count:
             return pd.DataFrame()
         
-        df = pd.DataFrame(self.alerts)
+        df = pd.DataFrame(columns, columns=self.ALERT_FIELDS)
+        with self._lock:
+            self._alerts_df_cache = (count, df)
         return df
     
     def get_alerts_by_hour(self) -> Dict[int, int]:
         """Get alert count by hour of day"""
-        hourly_counts = defaultdict(int)
-        
-        for alert in self.alerts:
-            hour = alert['timestamp'].hour
-            hourly_counts[hour] += 1
-        
-        # Fill in missing hours with 0
-        for hour in range(24):
-            if hour not in hourly_counts:
-                hourly_counts[hour] = 0
-        
-        return dict(sorted(hourly_counts.items()))
+        with self._lock:
+            return dict(enumerate(self._hourly_counts))
     
     def get_alerts_by_object(self) -> Dict[str, int]:
         """Get alert count by object type"""
-        object_counts = defaultdict(int)
-        
-        for alert in self.alerts:
-            object_counts[alert['object_name']] += 1
-        
-        return dict(object_counts)
+        with self._lock:
+            return dict(self._object_counts)
     
     def get_alerts_over_time(self, hours: int = 24) -> List[Dict]:
         """Get alerts over time (grouped by time intervals)"""
         cutoff = datetime.now() - timedelta(hours=hours)
-        recent_alerts = [a for a in self.alerts if a['timestamp'] >= cutoff]
         
-        # Group by 30-minute intervals
+        # Alerts are recorded in time order, so skip straight to the cutoff
+        with self._lock:
+            start = bisect.bisect_left(self._alert_timestamps, cutoff)
+            recent = self._alert_timestamps[start:]
+        
+        # Group by 30-minute intervals in a single pass, keyed by an integer
+        # bucket index (day ordinal * slots per day + slot) so no datetime is
+        # built per alert
         interval_minutes = 30
+        slots_per_day = 24 * 60 // interval_minutes
         time_groups = defaultdict(int)
         
-        for alert in recent_alerts:
-            # Round timestamp to nearest interval
-            minutes = (alert['timestamp'].minute // interval_minutes) * interval_minutes
-            time_key = alert['timestamp'].replace(minute=minutes, second=0, microsecond=0)
-            time_groups[time_key] += 1
+        for ts in recent:
+            slot = (ts.hour * 60 + ts.minute) // interval_minutes
+            time_groups[ts.toordinal() * slots_per_day + slot] += 1
         
         # Convert to list of dicts
         result = [
-            {'time': time_key, 'count': count}
-            for time_key, count in sorted(time_groups.items())
+            {
+                'time': datetime.fromordinal(bucket // slots_per_day)
+                        + timedelta(minutes=(bucket % slots_per_day) * interval_minutes),
+                'count': count
+            }
+            for bucket, count in sorted(time_groups.items())
         ]
         
         return result
     
+    def get_alerts_over_time_arrays(self, hours: int = 24) -> Tuple[np.ndarray, np.ndarray]:
+        """Get alerts over time as (bucket start times as datetime64[s], counts as int32) arrays"""
+        cutoff = datetime.now() - timedelta(hours=hours)
+        
+        with self._lock:
+            start = bisect.bisect_left(self._alert_timestamps, cutoff)
+            recent = np.array(self._alert_timestamps[start:], dtype='datetime64[s]')
+        
+        # Floor to 30-minute buckets and count; unique() returns them sorted
+        interval = np.timedelta64(30 * 60, 's')
+        buckets = recent - (recent - np.datetime64(0, 's')) % interval
+        times, counts = np.unique(buckets, return_counts=True)
+        return times, counts.astype(np.int32)
+    
+    def get_fps_history_arrays(self, samples: int = 100) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the last FPS samples as (wall-clock datetime64[ms], fps float32) arrays for plotting"""
+        with self._lock:
+            recent = self._fps_recent(samples)
+            start_ns, start_time = self._start_ns, self.start_time
+        
+        elapsed_ms = (recent['t_ns'] - start_ns) // 1_000_000
+        times = np.datetime64(start_time, 'ms') + elapsed_ms.astype('timedelta64[ms]')
+        return times, recent['fps'].astype(np.float32)
+    
     def get_fps_stats(self) -> Dict:
         """Get FPS statistics"""
-        if not self.fps_history:
-            return {
-                'current': 0,
-                'average': 0,
-                'min': 0,
-                'max': 0,
-                'history': []
-            }
-        
-        fps_values = [x['fps'] for x in self.fps_history]
+        with self._lock:
+            if not self._fps_count:
+                return {
+                    'current': 0,
+                    'average': 0,
+                    'min': 0,
+                    'max': 0,
+                    'history': []
+                }
+            
+            rolling = self._fps_rolling
+            current, average = self._fps_latest(), rolling.average
+            fps_min, fps_max = rolling.min, rolling.max
+            recent = self._fps_recent(100)
         
         return {
-            'current': round(fps_values[-1], 1),
-            'average': round(sum(fps_values) / len(fps_values), 1),
-            'min': round(min(fps_values), 1),
-            'max': round(max(fps_values), 1),
-            'history': self.fps_history[-100:]  # Last 100 samples for plotting
+            'current': round(current, 1),
+            'average': round(average, 1),
+            'min': round(fps_min, 1),
+            'max': round(fps_max, 1),
+            'history': [  # Last 100 samples for plotting, with wall-clock timestamps
+                {'timestamp': self._wall_time(t_ns), 'fps': fps}
+                for t_ns, fps in recent.tolist()
+            ]
         }
     
     def get_confidence_stats(self) -> Dict:
         """Get detection confidence statistics"""
-        if not self.detection_confidence_history:
+        with self._lock:
+            values = self._confidence_snapshot()
+        
+        if not len(values):
             return {
                 'average': 0,
                 'min': 0,
@@ -225,46 +460,80 @@ class StatisticsManager:
             }
         
         return {
-            'average': round(sum(self.detection_confidence_history) / len(self.detection_confidence_history) * 100, 1),
-            'min': round(min(self.detection_confidence_history) * 100, 1),
-            'max': round(max(self.detection_confidence_history) * 100, 1),
-            'distribution': self.detection_confidence_history
+            'average': round(float(values.mean()) * 100, 1),
+            'min': round(float(values.min()) * 100, 1),
+            'max': round(float(values.max()) * 100, 1),
+            'distribution': values.tolist()
         }
     
     def get_peak_alert_time(self) -> str:
         """Get the hour with most alerts"""
-        if not self.alerts:
-            return "No data"
+        with self._lock:
+            if not self.total_alerts:
+                return "No data"
+            hourly = list(self._hourly_counts)
         
-        hourly = self.get_alerts_by_hour()
-        peak_hour = max(hourly.items(), key=lambda x: x[1])[0]
+        peak_hour = max(range(24), key=hourly.__getitem__)
         
         return f"{peak_hour:02d}:00 - {peak_hour+1:02d}:00"
     
+    def get_snapshot(self, hours: int = 24) -> Dict:
+        """Get every dashboard aggregate in one call, so a refresh computes each only once"""
+        return {
+            'summary': self.get_summary_stats(),
+            'fps': self.get_fps_stats(),
+            'confidence': self.get_confidence_stats(),
+            'fps_history': self.get_fps_history_arrays(),
+            'alerts_over_time': self.get_alerts_over_time_arrays(hours=hours),
+            'alerts_by_object': self.get_alerts_by_object(),
+            'alerts_by_hour': self.get_alerts_by_hour(),
+            'peak_time': self.get_peak_alert_time(),
+        }
+    
     def reset_stats(self):
         """Reset all statistics"""
-        self.start_time = datetime.now()
-        self.session_id = self.start_time.strftime("%Y%m%d_%H%M%S")
-        self.alerts = []
-        self.total_alerts = 0
-        self.fps_history = []
-        self.objects_tracked_history = []
-        self.detection_confidence_history = []
-        self.emails_sent = 0
-        self.email_failures = 0
+        with self._lock:
+            self.start_time = datetime.now()
+            self._start_ns = time.monotonic_ns()  # Monotonic origin for uptime/FPS timing
+            self.session_id = self.start_time.strftime("%Y%m%d_%H%M%S")
+            self._alert_timestamps = []
+            self._alert_names = []
+            self._alert_ids = []
+            self._alert_rois = []
+            self._alert_confidences = []
+            self._alert_durations = []
+            self.total_alerts = 0
+            self._object_counts.clear()
+            self._hourly_counts = [0] * 24
+            self._start_new_day(self.start_time)
+            self._alerts_df_cache = None
+            self._fps_head = 0
+            self._fps_count = 0
+            self._fps_rolling.reset()
+            self.objects_tracked_history.clear()
+            self._confidence_head = 0
+            self._confidence_count = 0
+            self.emails_sent = 0
+            self.email_failures = 0
         
         print(f"📊 Statistics reset (New Session: {self.session_id})")
     
     def export_to_csv(self, filename: str = None) -> str:
         """Export alerts to CSV file"""
-        if not self.alerts:
+        with self._lock:
+            rows = list(self._iter_alert_rows())
+            session_id = self.session_id
+        
+        if not rows:
             return None
         
         if filename is None:
-            filename = f"statistics_{self.session_id}.csv"
+            filename = f"statistics_{session_id}.csv"
         
-        df = self.get_alerts_dataframe()
-        df.to_csv(filename, index=False)
+        with open(filename, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=self.ALERT_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
         
         print(f"📊 Statistics exported to: {filename}")
         return filename
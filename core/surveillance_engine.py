@@ -5,42 +5,111 @@ Separated from GUI for better architecture
 
 import cv2
 import numpy as np
+import torch
 from ultralytics import YOLO
+from ultralytics.utils.plotting import colors
 from core.state_manager import StateManager
 from core.statistics_manager import get_statistics_manager
 from utils.email_alerter import get_email_alerter
 import config
 import os
+import queue
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import time
 from typing import List, Dict, Tuple, Optional, Callable
 
+# Optional: libjpeg-turbo encoder for snapshots (falls back to cv2.imwrite)
+try:
+    from turbojpeg import TurboJPEG
+    _turbo_jpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    _turbo_jpeg = None
+
+
+def _save_jpeg(filename: str, frame: np.ndarray):
+    """Encode and write a BGR frame as JPEG at config.JPEG_QUALITY"""
+    if _turbo_jpeg is not None:
+        with open(filename, "wb") as f:
+            f.write(_turbo_jpeg.encode(frame, quality=config.JPEG_QUALITY))
+    else:
+        cv2.imwrite(filename, frame, [cv2.IMWRITE_JPEG_QUALITY, config.JPEG_QUALITY])
+
+
+def _match_rois(rois: np.ndarray, boxes: np.ndarray) -> np.ndarray:
+    """
+    Best box for each ROI by overlap (fraction of the box inside the ROI)
+    Returns an (M, 2) float32 array of [best box index, best overlap] per ROI
+    """
+    inter_x1 = np.maximum(rois[:, None, 0], boxes[None, :, 0])
+    inter_y1 = np.maximum(rois[:, None, 1], boxes[None, :, 1])
+    inter_x2 = np.minimum(rois[:, None, 2], boxes[None, :, 2])
+    inter_y2 = np.minimum(rois[:, None, 3], boxes[None, :, 3])
+    inter_area = np.clip(inter_x2 - inter_x1, 0, None) * np.clip(inter_y2 - inter_y1, 0, None)
+    box_area = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    overlap = np.where(box_area > 0, inter_area / np.where(box_area > 0, box_area, 1), 0)
+    return np.stack([overlap.argmax(axis=1), overlap.max(axis=1)], axis=1).astype(np.float32)
+
 
 class SurveillanceEngine:
     """Main surveillance engine handling all tracking and monitoring logic"""
     
+    # ROI box/label colors (BGR) per state
+    STATE_COLORS = {
+        "SECURED": (0, 255, 0),        # Green
+        "INITIALIZING": (0, 255, 255),  # Yellow
+        "ALERT": (0, 0, 255),          # Red
+    }
+    
     def __init__(self, model_path: str = None, video_source: int = 0):
         """Initialize the surveillance engine"""
         self.model_path = model_path or config.MODEL_PATH
         self.video_source = video_source if video_source is not None else config.VIDEO_SOURCE
-        self.alert_threshold = config.ALERT_THRESHOLD
+        # One-item list shared by every ROI's StateManager, so a threshold change is a single write
+        self._threshold_ref = [config.ALERT_THRESHOLD]
         
         self.model = None
+        self.loaded_model_path = None  # .pt or exported .engine actually in use
+        self.infer_size = config.INFERENCE_SIZE
+        self.batch_size = max(1, config.INFERENCE_BATCH_SIZE)
+        self.infer_stride = max(1, config.INFER_STRIDE)
+        self.frame_idx = 0  # Frames seen by the inference thread, for the stride
+        self._last_detections = None  # Detections reused on frames skipped by the stride
+        self.half = torch.cuda.is_available()  # FP16 inference on GPU
+        self._infer_resize = None  # (frame shape, target size, scale) cached from the first frame
         self.cap = None
         self.roi_targets = []
         self.current_frame = None
         self.reference_frame = None  # Store the captured frame for reselection
+        self._window_open = False  # Whether an OpenCV HighGUI window has been shown
         self.is_monitoring = False
         
+        # Monitoring pipeline: capture thread -> capture_q -> inference thread -> render_q -> process_frame
+        self.capture_q = queue.Queue(maxsize=max(2, self.batch_size))
+        self.render_q = queue.Queue(maxsize=2)
+        self._pipeline_stop = threading.Event()  # Replaced per run; set while no run is active
+        self._pipeline_stop.set()
+        self._pipeline_threads = []
+        self._cap_lock = threading.Lock()  # GUI preview and capture thread share self.cap
+        
         # Statistics
         self.total_alerts = 0
         self.alert_history = []
         self.captured_frames = []
         self.stats_manager = get_statistics_manager()
+        # Create output directories once up front
+        for path in ("output/captured_frames", "output/alerts"):
+            os.makedirs(path, exist_ok=True)
+        # Single worker so snapshot writes and their emails stay in order off the frame loop
+        self._alert_io_executor = ThreadPoolExecutor(max_workers=1)
         
         # Performance tracking
-        self.fps_counter = 0
-        self.fps_start_time = time.time()
+        self.fps_counter = 0  # Frames rendered; stats are sampled every 32 frames
+        self._last_frame_ns = time.monotonic_ns()
+        self._frame_interval_ns = 0
+        self._last_confidence_sample = 0
         self.current_fps = 0
         
         # Callbacks for GUI updates
@@ -48,20 +117,113 @@ class SurveillanceEngine:
         self.on_status_update: Optional[Callable] = None
         self.on_alert: Optional[Callable] = None
         
+    @property
+    def alert_threshold(self) -> int:
+        return self._threshold_ref[0]
+    
+    @alert_threshold.setter
+    def alert_threshold(self, threshold: int):
+        self._threshold_ref[0] = threshold
+    
+    @property
+    def roi_targets(self) -> List[Dict]:
+        return self._roi_targets
+    
+    @roi_targets.setter
+    def roi_targets(self, targets: List[Dict]):
+        self._roi_targets = targets
+        # Target IDs in ROI order, for the per-frame presence check
+        self._target_ids = np.array([t['target_id'] for t in targets], dtype=np.int64)
+    
     def load_model(self) -> bool:
-        """Load the YOLO model"""
+        """Load the YOLO model (as a TensorRT FP16 or OpenVINO INT8 export when enabled)"""
         try:
-            print(f"Loading model: {self.model_path}")
-            self.model = YOLO(self.model_path)
+            if torch.cuda.is_available():
+                # TF32 tensor-core matmuls, and cuDNN autotuning (input shape is fixed)
+                torch.set_float32_matmul_precision("high")
+                torch.backends.cudnn.benchmark = True
+            
+            model_path = self._resolve_model_path()
+            print(f"Loading model: {model_path}")
+            self.model = YOLO(model_path, task="detect")
+            self.loaded_model_path = model_path
             return True
         except Exception as e:
             print(f"Error loading model: {e}")
             return False
     
+    def _resolve_model_path(self) -> str:
+        """
+        Return the model file to load. The .pt checkpoint is exported once and
+        reused on later runs: to a TensorRT FP16 .engine with USE_TENSORRT on a
+        CUDA machine, or to an INT8 OpenVINO model with USE_OPENVINO_INT8 on a
+        CPU-only machine. Otherwise (or if export fails) the original path is used.
+        """
+        if not self.model_path.endswith(".pt"):
+            return self.model_path  # Already an exported model
+        
+        # The input shape is fixed at export, so it is part of the name: changing
+        # INFERENCE_SIZE or INFERENCE_BATCH_SIZE exports a new model instead of loading a stale one
+        stem = f"{os.path.splitext(self.model_path)[0]}_{self.infer_size}_b{self.batch_size}"
+        if torch.cuda.is_available():
+            if config.USE_TENSORRT:
+                return self._export_model("TensorRT FP16 engine", stem + ".engine",
+                                          format="engine", half=True, simplify=True)
+        elif config.USE_OPENVINO_INT8:
+            return self._export_model("OpenVINO INT8 model", stem + "_int8_openvino_model",
+                                      format="openvino", int8=True, data="coco128.yaml")
+        return self.model_path
+    
+    def _export_model(self, label: str, export_path: str, **export_args) -> str:
+        """Export the .pt checkpoint to export_path unless it already exists; fall back to the .pt on failure"""
+        if os.path.exists(export_path):
+            return export_path
+        try:
+            print(f"Exporting {label} (one-time): {export_path}")
+            exported = YOLO(self.model_path).export(
+                dynamic=self.batch_size > 1, batch=self.batch_size,
+                imgsz=self.infer_size, **export_args
+            )
+            os.replace(exported, export_path)  # Ultralytics names the output after the .pt
+            return export_path
+        except Exception as e:
+            print(f"{label} export failed, using PyTorch model: {e}")
+            return self.model_path
+    
+    def _inference_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, float]:
+        """
+        Downscale a frame so its longer side matches infer_size (aspect ratio kept)
+        Returns: (frame to run inference on, scale from frame to inference coords)
+        """
+        if self._infer_resize is None or self._infer_resize[0] != frame.shape:
+            h, w = frame.shape[:2]
+            scale = min(1.0, self.infer_size / max(h, w))
+            size = (round(w * scale), round(h * scale))
+            self._infer_resize = (frame.shape, size, scale)
+        
+        _, size, scale = self._infer_resize
+        if scale == 1.0:
+            return frame, 1.0
+        return cv2.resize(frame, size, interpolation=cv2.INTER_AREA), scale
+    
+    def _track(self, frame):
+        """
+        Run the tracker on downscaled copies of a frame or a list of consecutive frames
+        Returns: (results, scale); divide result boxes by scale for frame coordinates
+        """
+        frames = frame if isinstance(frame, list) else [frame]
+        inputs = [self._inference_frame(f) for f in frames]
+        scale = inputs[0][1]
+        source = [small for small, _ in inputs] if isinstance(frame, list) else inputs[0][0]
+        kwargs = {'half': True} if self.half else {}
+        results = self.model.track(source, persist=True, verbose=False,
+                                   imgsz=self.infer_size, **kwargs)
+        return results, scale
+    
     def initialize_camera(self) -> bool:
         """Initialize video capture"""
         try:
-            self.cap = cv2.VideoCapture(self.video_source)
+            self.cap = self._open_capture()
             if not self.cap.isOpened():
                 print(f"Error: Could not open video source {self.video_source}")
                 return False
@@ -70,13 +232,45 @@ class SurveillanceEngine:
             print(f"Error initializing camera: {e}")
             return False
     
+    def _open_capture(self) -> cv2.VideoCapture:
+        """
+        Open the video source on the cheapest decode path available:
+        MJPG for USB cameras (libjpeg-turbo decode instead of raw YUYV copies),
+        and a GStreamer decodebin pipeline for files/streams so hardware decoders
+        (VA-API/NVDEC) are used when installed. Falls back to OpenCV's default.
+        """
+        if isinstance(self.video_source, int):
+            cap = cv2.VideoCapture(self.video_source)
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Keep only the newest frame in the driver queue (ignored by some backends)
+            return cap
+        
+        if config.USE_GSTREAMER_DECODE and re.search(r"GStreamer:\s+YES", cv2.getBuildInformation()):
+            source = str(self.video_source)
+            if "://" in source:
+                src = f'rtspsrc location="{source}" latency=0' if source.startswith("rtsp") else f'souphttpsrc location="{source}"'
+                sink = "appsink drop=true max-buffers=1 sync=false"
+            else:
+                src = f'filesrc location="{source}"'
+                sink = "appsink sync=false"
+            pipeline = f"{src} ! decodebin ! videoconvert ! video/x-raw,format=BGR ! {sink}"
+            cap = cv2.VideoCapture(pipeline, cv2.CAP_GSTREAMER)
+            if cap.isOpened():
+                print("Using GStreamer decode pipeline")
+                return cap
+            cap.release()
+        
+        return cv2.VideoCapture(self.video_source)
+    
     def get_frame(self) -> Tuple[bool, Optional[np.ndarray]]:
         """Read a frame from the camera"""
         if self.cap is None:
             return False, None
         
-        success, frame = self.cap.read()
+        with self._cap_lock:
+            success, frame = self.cap.read()
         if success:
+            # Keep a clean copy: the returned buffer goes on to process_frame, which draws on it
             self.current_frame = frame.copy()
         return success, frame
     
@@ -92,10 +286,8 @@ class SurveillanceEngine:
         # Store as reference frame for reselection
         self.reference_frame = frame_copy.copy()
         
-        # Create output directory if it doesn't exist
-        os.makedirs("output/captured_frames", exist_ok=True)
         filename = f"output/captured_frames/frame_{timestamp}.jpg"
-        cv2.imwrite(filename, frame_copy)
+        _save_jpeg(filename, frame_copy)
         
         self.captured_frames.append({
             'timestamp': timestamp,
@@ -117,18 +309,23 @@ class SurveillanceEngine:
                 # Custom multi-ROI selector to avoid cv2.selectROIs bugs
                 return self._custom_multi_roi_selector(frame, window_name)
             else:
+                self._window_open = True
                 roi = cv2.selectROI(window_name, frame, fromCenter=False, showCrosshair=True)
-                cv2.destroyAllWindows()
-                for _ in range(3):
-                    cv2.waitKey(1)
+                self._flush_windows()
                 return roi
         except Exception as e:
             print(f"Error during ROI selection: {e}")
-            cv2.destroyAllWindows()
-            for _ in range(3):
-                cv2.waitKey(1)
+            self._flush_windows()
             return () if multi else (0, 0, 0, 0)
     
+    def _flush_windows(self):
+        """Close any OpenCV HighGUI windows (no-op if none were opened)"""
+        if not self._window_open:
+            return
+        cv2.destroyAllWindows()
+        cv2.pollKey()  # Pump the event loop once (without waitKey's 1 ms wait) so the windows actually close
+        self._window_open = False
+    
     def _custom_multi_roi_selector(self, frame: np.ndarray, window_name: str):
         """Custom implementation of multi-ROI selection to avoid cv2.selectROIs bugs"""
         print("\n" + "=" * 60)
@@ -164,6 +361,7 @@ class SurveillanceEngine:
                        cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 255), 2)
             
             # Let user select ROI
+            self._window_open = True
             roi = cv2.selectROI(window_name, display_frame, fromCenter=False, showCrosshair=True)
             x, y, w, h = roi
             
@@ -199,9 +397,7 @@ class SurveillanceEngine:
                 
                 if len(rois) == 0:
                     print("❌ No ROIs selected. Exiting...")
-                    cv2.destroyAllWindows()
-                    for _ in range(3):
-                        cv2.waitKey(1)
+                    self._flush_windows()
                     return np.array([])
                 else:
                     # Ask if user wants to finish with current ROIs
@@ -220,13 +416,11 @@ class SurveillanceEngine:
                         continue_selection = False
                         print(f"✅ Finished with {len(rois)} ROI(s).")
         
-        cv2.destroyAllWindows()
-        for _ in range(3):
-            cv2.waitKey(1)
+        self._flush_windows()
         return np.array(rois)
     
     def setup_single_roi(self, frame: np.ndarray) -> bool:
-        """Setup single ROI tracking"""
+        """Setup single ROI tracking (frame is only read, never modified)"""
         print("\n=== Single ROI Mode ===")
         
         # Select ROI
@@ -263,10 +457,10 @@ class SurveillanceEngine:
         roi_coords = (int(x), int(y), int(x2), int(y2))
         
         # Run tracker on the frame
-        track_results = self.model.track(frame, persist=True, verbose=False)
+        track_results, scale = self._track(frame)
         
         # Find tracked object in ROI
-        self.roi_targets = self._find_tracked_objects_in_rois(track_results, [roi_coords])
+        self.roi_targets = self._find_tracked_objects_in_rois(track_results, [roi_coords], scale)
         
         if not self.roi_targets:
             print("Warning: No tracked object found in ROI.")
@@ -276,7 +470,7 @@ class SurveillanceEngine:
         return True
     
     def setup_multiple_rois(self, frame: np.ndarray) -> bool:
-        """Setup multiple ROI tracking"""
+        """Setup multiple ROI tracking (frame is only read, never modified)"""
         print("\n=== Multiple ROI Mode ===")
         # Use OpenCV's selectROIs to allow multiple selection in one window
         rois = self.select_roi_coords(frame, "Select Multiple ROIs", multi=True)
@@ -311,10 +505,10 @@ class SurveillanceEngine:
 
         print(f"🔍 Running object detection on frame to assign tracking IDs...")
         # Run tracker on the frame
-        track_results = self.model.track(frame, persist=True, verbose=False)
+        track_results, scale = self._track(frame)
 
         # Find tracked objects in all ROIs
-        self.roi_targets = self._find_tracked_objects_in_rois(track_results, rois_list)
+        self.roi_targets = self._find_tracked_objects_in_rois(track_results, rois_list, scale)
         
         if not self.roi_targets:
             print("❌ Warning: No tracked objects found in any ROI. Make sure objects are visible in the selected areas.")
@@ -325,9 +519,11 @@ class SurveillanceEngine:
             print(f"   - Object {idx+1}: {target['target_name']} (ID: {target['target_id']})")
         return True
     
-    def _find_tracked_objects_in_rois(self, results, rois_list: List[Tuple]) -> List[Dict]:
+    def _find_tracked_objects_in_rois(self, results, rois_list: List[Tuple],
+                                      scale: float = 1.0) -> List[Dict]:
         """
         Find which tracked objects are in each ROI
+        ROIs are in frame coordinates; boxes are mapped back from inference scale
         Returns list of dicts with 'initial_roi', 'target_id', 'target_name', 'state_manager'
         """
         roi_targets = []
@@ -342,42 +538,23 @@ class SurveillanceEngine:
             print("Warning: No objects detected in initial frame.")
             return roi_targets
         
-        # Get tracked data
-        boxes = result.boxes.xyxy.cpu().numpy()
-        classes = result.boxes.cls.cpu().numpy()
+        # Get tracked data (boxes scaled back to frame coordinates)
+        detections = self._extract_detections(results, scale)
+        boxes = detections['boxes']
+        classes = detections['classes']
         
-        if result.boxes.id is not None:
-            track_ids = result.boxes.id.cpu().numpy()
+        if detections['ids'] is not None:
+            track_ids = detections['ids']
         else:
             print("Warning: No tracking IDs assigned yet.")
             return roi_targets
         
-        # For each ROI, find best matching tracked object
+        matches = _match_rois(np.asarray(rois_list, dtype=np.float32), boxes.astype(np.float32))
+        
+        # For each ROI, take the best matching tracked object
         for roi_idx, roi_coords in enumerate(rois_list):
-            rx1, ry1, rx2, ry2 = roi_coords
-            
-            best_match = None
-            best_overlap = 0
-            
-            for i in range(len(boxes)):
-                bx1, by1, bx2, by2 = boxes[i]
-                
-                # Calculate overlap
-                inter_x1 = max(rx1, bx1)
-                inter_y1 = max(ry1, by1)
-                inter_x2 = min(rx2, bx2)
-                inter_y2 = min(ry2, by2)
-                
-                if inter_x1 < inter_x2 and inter_y1 < inter_y2:
-                    inter_area = (inter_x2 - inter_x1) * (inter_y2 - inter_y1)
-                    box_area = (bx2 - bx1) * (by2 - by1)
-                    overlap_ratio = inter_area / box_area if box_area > 0 else 0
-                    
-                    if overlap_ratio > best_overlap:
-                        best_overlap = overlap_ratio
-                        best_match = i
-            
-            if best_match is not None:
+            if matches[roi_idx, 1] > 0:
+                best_match = int(matches[roi_idx, 0])
                 target_id = int(track_ids[best_match])
                 class_id = int(classes[best_match])
                 target_name = self.model.names[class_id]
@@ -386,15 +563,46 @@ class SurveillanceEngine:
                     'initial_roi': roi_coords,
                     'target_id': target_id,
                     'target_name': target_name,
-                    'state_manager': StateManager(self.alert_threshold)
+                    'state_manager': StateManager(self._threshold_ref)
                 })
                 
                 print(f"ROI #{roi_idx+1}: Found '{target_name}' with tracking ID={target_id}")
             else:
                 print(f"ROI #{roi_idx+1}: No object detected inside this ROI")
         
+        # Labels and box corners never change after setup, so compute them once
+        # (labels are rendered once per state color; all sprites share one height)
+        for idx, roi_data in enumerate(roi_targets):
+            x1, y1, x2, y2 = (int(v) for v in roi_data['initial_roi'])
+            label = f"ROI{idx+1}: {roi_data['target_name']} (ID:{roi_data['target_id']})"
+            sprites = self._render_label_sprites(label)
+            roi_data['label_sprites'] = sprites
+            roi_data['tl'], roi_data['br'] = (x1, y1), (x2, y2)
+            roi_data['label_pos'] = (x1, y1 - sprites['SECURED'].shape[0] + 1)
+        
         return roi_targets
     
+    def _render_label_sprites(self, label: str) -> Dict[str, np.ndarray]:
+        """Pre-render an ROI label (white text on a state-colored background) for each state"""
+        (text_width, text_height), _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)
+        sprites = {}
+        for state, color in self.STATE_COLORS.items():
+            sprite = np.empty((text_height + 11, text_width + 1, 3), dtype=np.uint8)
+            sprite[:] = color
+            cv2.putText(sprite, label, (0, text_height + 5),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+            sprites[state] = sprite
+        return sprites
+    
+    @staticmethod
+    def _blit(frame: np.ndarray, sprite: np.ndarray, x: int, y: int):
+        """Copy a sprite into the frame with its top-left corner at (x, y), clipped to the frame"""
+        h, w = sprite.shape[:2]
+        fx1, fy1 = max(x, 0), max(y, 0)
+        fx2, fy2 = min(x + w, frame.shape[1]), min(y + h, frame.shape[0])
+        if fx1 < fx2 and fy1 < fy2:
+            frame[fy1:fy2, fx1:fx2] = sprite[fy1 - y:fy2 - y, fx1 - x:fx2 - x]
+    
     def process_frame(self) -> Tuple[bool, Optional[np.ndarray], bool]:
         """
         Process one frame during monitoring
@@ -403,66 +611,78 @@ class SurveillanceEngine:
         if not self.is_monitoring or self.model is None:
             return False, None, False
         
-        success, frame = self.get_frame()
-        if not success:
+        # Frames are captured and tracked by the pipeline threads; this only renders
+        try:
+            item = self.render_q.get(timeout=1.0)
+        except queue.Empty:
             return False, None, False
+        if item is None:  # End of stream
+            return False, None, False
+        frame, results, scale = item
+        
+        # Frames skipped by the inference stride reuse the last detections
+        fresh = results is not None
+        if fresh:
+            self._last_detections = self._extract_detections(results, scale)
+        detections = self._last_detections
+        
+        # Calculate FPS from an exponential moving average of the frame interval
+        # (averaging intervals, not rates, keeps batched frame bursts from inflating it)
+        now_ns = time.monotonic_ns()
+        dt_ns = now_ns - self._last_frame_ns
+        self._last_frame_ns = now_ns
+        self._frame_interval_ns = dt_ns if self._frame_interval_ns == 0 else 0.9 * self._frame_interval_ns + 0.1 * dt_ns
+        if self._frame_interval_ns > 0:
+            self.current_fps = 1e9 / self._frame_interval_ns
         
-        # Calculate FPS
         self.fps_counter += 1
-        elapsed = time.time() - self.fps_start_time
-        if elapsed >= 1.0:  # Update FPS every second
-            self.current_fps = self.fps_counter / elapsed
+        sample_stats = self.fps_counter & 31 == 0
+        if sample_stats:
             self.stats_manager.record_fps(self.current_fps)
-            self.fps_counter = 0
-            self.fps_start_time = time.time()
-        
-        # Run tracker on full frame
-        results = self.model.track(frame, persist=True, verbose=False)
-        
-        # Get currently tracked IDs
-        current_detected_ids = set()
-        if results and len(results) > 0 and results[0].boxes.id is not None:
-            current_detected_ids = set(results[0].boxes.id.int().cpu().tolist())
+            if config.ADAPTIVE_INFER_STRIDE:
+                self._adapt_infer_stride()
+        
+        # Which ROI targets are among the currently tracked IDs (one vectorized lookup)
+        num_tracked = 0
+        present_mask = np.zeros(len(self._target_ids), dtype=bool)
+        if detections is not None and detections['ids'] is not None:
+            num_tracked = len(detections['ids'])
+            present_mask = np.isin(self._target_ids, detections['ids'])
             
-            # Record detection confidence (only every 30 frames to reduce overhead)
-            if self.fps_counter % 30 == 0 and results[0].boxes.conf is not None:
-                confidences = results[0].boxes.conf.cpu().tolist()
-                for conf in confidences:
+            # Record detection confidence (only every ~32 frames to reduce overhead)
+            if fresh and self.fps_counter - self._last_confidence_sample >= 32:
+                self._last_confidence_sample = self.fps_counter
+                for conf in detections['confs'].tolist():
                     self.stats_manager.record_detection_confidence(conf)
         
-        # Record number of objects tracked (only every 30 frames to reduce overhead)
-        if self.fps_counter % 30 == 0:
-            self.stats_manager.record_objects_tracked(len(current_detected_ids))
+        # Record number of objects tracked (only every 32 frames to reduce overhead)
+        if sample_stats:
+            self.stats_manager.record_objects_tracked(num_tracked)
         
-        # Draw tracker boxes first (on a copy)
-        if results and len(results) > 0:
-            annotated_frame = results[0].plot()
-        else:
-            annotated_frame = frame.copy()
+        # Draw tracker boxes first, straight onto the frame (get_frame keeps its own
+        # copy in current_frame, so captures and ROI setup never see these overlays)
+        annotated_frame = frame
+        if detections is not None:
+            self._draw_detections(annotated_frame, detections)
         
         # Check each target and draw ROI boxes on the annotated frame
         any_alert = False
         alert_objects = []  # Track which objects are in alert state
         
         for idx, roi_data in enumerate(self.roi_targets):
-            initial_roi = roi_data['initial_roi']
             target_id = roi_data['target_id']
             target_name = roi_data['target_name']
             state_mgr = roi_data['state_manager']
             
             # Check if target is present
-            object_present = target_id in current_detected_ids
+            object_present = bool(present_mask[idx])
             
             # Update state
             current_state = state_mgr.update_status(object_present)
             
             # Determine color
-            if current_state == "SECURED":
-                color = (0, 255, 0)  # Green
-            elif current_state == "INITIALIZING":
-                color = (0, 255, 255)  # Yellow
-            else:  # ALERT
-                color = (0, 0, 255)  # Red
+            color = self.STATE_COLORS[current_state]
+            if current_state == "ALERT":
                 any_alert = True
                 
                 # Check if this object hasn't triggered an alert yet (per-ROI tracking)
@@ -479,23 +699,10 @@ class SurveillanceEngine:
                 roi_data['alert_triggered'] = False
             
             # Draw ROI on annotated frame (not original)
-            x1, y1, x2, y2 = initial_roi
-            cv2.rectangle(annotated_frame, (x1, y1), (x2, y2), color, 3)
+            cv2.rectangle(annotated_frame, roi_data['tl'], roi_data['br'], color, 3)
             
-            # Label with background for better visibility
-            label = f"ROI{idx+1}: {target_name} (ID:{target_id})"
-            # Get text size
-            (text_width, text_height), baseline = cv2.getTextSize(
-                label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2
-            )
-            # Draw background rectangle
-            cv2.rectangle(annotated_frame, 
-                         (x1, y1-text_height-10), 
-                         (x1+text_width, y1),
-                         color, -1)
-            # Draw text
-            cv2.putText(annotated_frame, label, (x1, y1-5),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+            # Label with background for better visibility (pre-rendered at setup)
+            self._blit(annotated_frame, roi_data['label_sprites'][current_state], *roi_data['label_pos'])
         
         # Handle alerts for objects that just entered ALERT state
         if len(alert_objects) > 0:
@@ -510,14 +717,50 @@ class SurveillanceEngine:
         
         return True, annotated_frame, any_alert
     
+    def _extract_detections(self, results, scale: float) -> Optional[Dict]:
+        """
+        Pull boxes (frame coordinates), track IDs, classes and confidences to numpy
+        Boxes.data already packs [x1, y1, x2, y2, (track_id), conf, cls], so this is
+        a single device-to-host transfer per frame
+        """
+        if not results or len(results) == 0 or results[0].boxes is None:
+            return None
+        boxes = results[0].boxes
+        data = boxes.data.cpu().numpy()
+        return {
+            'boxes': data[:, :4] / scale,
+            'ids': data[:, 4].astype(np.int64) if boxes.is_track else None,
+            'classes': data[:, -1].astype(np.int32),
+            'confs': data[:, -2],
+        }
+    
+    def _draw_detections(self, frame: np.ndarray, detections: Dict):
+        """Draw tracker boxes and labels in place (replaces Results.plot())"""
+        ids = detections['ids']
+        for i, ((x1, y1, x2, y2), class_id, conf) in enumerate(
+                zip(detections['boxes'].astype(np.int32).tolist(), detections['classes'], detections['confs'])):
+            color = colors(int(class_id), True)
+            label = f"{self.model.names[int(class_id)]} {conf:.2f}"
+            if ids is not None:
+                label = f"id:{ids[i]} {label}"
+            cv2.rectangle(frame, (x1, y1), (x2, y2), color, 2)
+            cv2.putText(frame, label, (x1, max(y1 - 5, 10)),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
+    
+    def _adapt_infer_stride(self):
+        """Trade detection rate for frame rate: widen the stride while FPS is below target"""
+        if self.current_fps < config.TARGET_FPS and self.infer_stride < config.MAX_INFER_STRIDE:
+            self.infer_stride += 1
+        elif self.current_fps > config.TARGET_FPS * 1.2 and self.infer_stride > max(1, config.INFER_STRIDE):
+            self.infer_stride -= 1
+    
     def _trigger_alert(self, frame: np.ndarray, alert_objects: List[Dict]):
         """Trigger an alert and save snapshot for specific objects"""
         timestamp = datetime.now()
         
-        # Save alert image
-        os.makedirs("output/alerts", exist_ok=True)
+        # Alert image is encoded and written on the alert I/O worker
         filename = f"output/alerts/alert_{timestamp.strftime('%Y%m%d_%H%M%S')}.jpg"
-        cv2.imwrite(filename, frame)
+        frame_to_save = frame.copy()
         
         # Use the provided alert_objects list (objects that just entered ALERT state)
         missing_objects = alert_objects
@@ -533,7 +776,7 @@ class SurveillanceEngine:
         }
         self.alert_history.append(alert_record)
         
-        print(f"🚨 ALERT! Snapshot saved: {filename}")
+        print(f"🚨 ALERT! Saving snapshot: {filename}")
         print(f"Missing objects: {[obj['name'] for obj in missing_objects]}")
         
         # Record statistics for each missing object
@@ -545,22 +788,17 @@ class SurveillanceEngine:
             )
             print(f"📊 Alert recorded: {obj['name']} (Total: {self.stats_manager.total_alerts})")
         
-        # Send email alerts asynchronously (in background thread)
-        def send_emails_async():
+        # Save the snapshot and send email alerts asynchronously (on the alert I/O worker)
+        def save_and_email_async():
+            _save_jpeg(filename, frame_to_save)
+            
+            # One email for all objects that went missing together
             email_alerter = get_email_alerter()
-            for obj in missing_objects:
-                success = email_alerter.send_alert(
-                    object_name=obj['name'],
-                    object_id=obj['id'],
-                    image_path=filename,
-                    roi_index=obj.get('roi_index')
-                )
+            for success in email_alerter.send_alerts(missing_objects, image_path=filename):
                 self.stats_manager.record_email_sent(success)
         
-        # Start email sending in background thread (non-blocking)
-        import threading
-        email_thread = threading.Thread(target=send_emails_async, daemon=True)
-        email_thread.start()
+        # Hand off disk and network I/O (non-blocking)
+        self._alert_io_executor.submit(save_and_email_async)
         
         # Callback
         if self.on_alert:
@@ -568,26 +806,174 @@ class SurveillanceEngine:
     
     def start_monitoring(self):
         """Start monitoring mode"""
+        self._start_pipeline()
         self.is_monitoring = True
         print("✓ Monitoring started")
     
     def stop_monitoring(self):
         """Stop monitoring mode"""
+        self._stop_pipeline()
         self.is_monitoring = False
         print("✓ Monitoring stopped")
     
+    def pause_pipeline(self):
+        """Stop per-frame capture and tracking while the video feed is stopped (monitoring stays on)"""
+        self._stop_pipeline()
+    
+    def resume_pipeline(self):
+        """Restart the pipeline after pause_pipeline if monitoring is still on"""
+        if self.is_monitoring and self._pipeline_stop.is_set():
+            self._start_pipeline()
+    
+    def _start_pipeline(self):
+        """Start a pipeline run feeding process_frame (returns at once; called from the Tk thread)"""
+        self._pipeline_stop.set()  # Stop the previous run, if any
+        previous = self._pipeline_threads
+        stop = self._pipeline_stop = threading.Event()
+        self._last_detections = None
+        self._last_frame_ns = time.monotonic_ns()
+        self._frame_interval_ns = 0
+        self.current_fps = 0
+        self._pipeline_threads = [
+            threading.Thread(target=self._run_pipeline, args=(previous, stop), daemon=True)
+        ]
+        self._pipeline_threads[0].start()
+    
+    def _stop_pipeline(self):
+        """Signal the pipeline to stop; returns at once (the next run waits for these threads to exit)"""
+        self._pipeline_stop.set()
+    
+    def _join_pipeline(self, timeout: Optional[float] = None):
+        """Wait for the pipeline threads to exit"""
+        for thread in self._pipeline_threads:
+            thread.join(timeout)
+    
+    def _run_pipeline(self, previous: List[threading.Thread], stop: threading.Event):
+        """
+        Pipeline supervisor: wait for the previous run to exit, then run the capture
+        and inference stages until stop is set. Waiting here rather than in the caller
+        keeps the GUI responsive while a model.track call or a stalled read finishes,
+        and two runs never share the predictor or tracker state.
+        """
+        for thread in previous:
+            thread.join()
+        if stop.is_set():
+            return
+        
+        # Discard frames left over from the previous run
+        for q in (self.capture_q, self.render_q):
+            while True:
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    break
+        self.frame_idx = 0
+        
+        stages = [
+            threading.Thread(target=self._capture_loop, args=(stop,), daemon=True),
+            threading.Thread(target=self._inference_loop, args=(stop,), daemon=True),
+        ]
+        for thread in stages:
+            thread.start()
+        for thread in stages:
+            thread.join()
+    
+    def _queue_put(self, q: queue.Queue, item, stop: threading.Event):
+        """
+        Hand an item to the next pipeline stage. Live cameras drop the oldest
+        queued item so output stays real-time; video files wait so no frame is skipped.
+        """
+        if isinstance(self.video_source, int):
+            try:
+                q.put_nowait(item)
+            except queue.Full:
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    pass
+                q.put_nowait(item)
+            return
+        
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+    
+    def _capture_loop(self, stop: threading.Event):
+        """Pipeline stage 1: read frames from the camera"""
+        while not stop.is_set():
+            success, frame = self.get_frame()
+            if not success:
+                self._queue_put(self.capture_q, None, stop)
+                return
+            self._queue_put(self.capture_q, frame, stop)
+    
+    def _inference_loop(self, stop: threading.Event):
+        """Pipeline stage 2: run the tracker on batches of captured frames"""
+        while not stop.is_set():
+            try:
+                frame = self.capture_q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            
+            # Batch whatever frames are already waiting (never wait for more)
+            frames = [frame]
+            while frame is not None and len(frames) < self.batch_size:
+                try:
+                    frame = self.capture_q.get_nowait()
+                except queue.Empty:
+                    break
+                frames.append(frame)
+            end_of_stream = frames[-1] is None
+            if end_of_stream:
+                frames.pop()
+            
+            # Only every infer_stride-th frame is tracked; the rest are passed with results=None
+            tracked = []
+            for frame in frames:
+                tracked.append(self.frame_idx % self.infer_stride == 0)
+                self.frame_idx += 1
+            
+            to_track = [f for f, is_tracked in zip(frames, tracked) if is_tracked]
+            results, scale = [], 1.0
+            if to_track:
+                try:
+                    results, scale = self._track(to_track)
+                except Exception as e:
+                    print(f"Error during tracking: {e}")
+                    self._queue_put(self.render_q, None, stop)
+                    return
+            
+            results = iter(results)
+            for frame, is_tracked in zip(frames, tracked):
+                result = [next(results)] if is_tracked else None
+                self._queue_put(self.render_q, (frame, result, scale), stop)
+            
+            if end_of_stream:
+                self._queue_put(self.render_q, None, stop)
+                return
+    
     def reset_tracking(self):
         """Reset tracker and ROIs"""
         self.roi_targets = []
         self.is_monitoring = False
         self.alert_triggered = False
         
-        # Reload model to reset tracker
-        if self.model_path:
-            self.model = YOLO(self.model_path)
+        # Reset the tracker state in place; weights stay loaded
+        predictor = getattr(self.model, "predictor", None)
+        if predictor is not None and getattr(predictor, "trackers", None):
+            for tracker in predictor.trackers:
+                tracker.reset()
+        self._last_detections = None
         
         print("✓ Tracking reset")
     
+    def pending_frames(self) -> int:
+        """Number of tracked frames waiting for process_frame (non-zero means the caller is behind)"""
+        return self.render_q.qsize()
+    
     def get_status(self) -> Dict:
         """Get current status information"""
         # Check if any ROI is currently in alert state
@@ -618,7 +1004,9 @@ class SurveillanceEngine:
     
     def cleanup(self):
         """Release resources"""
+        self._stop_pipeline()
+        self._join_pipeline(timeout=2.0)  # Bounded: the app is closing
         if self.cap is not None:
             self.cap.release()
-        cv2.destroyAllWindows()
+        self._flush_windows()
         print("✓ Resources released")
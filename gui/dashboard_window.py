@@ -5,14 +5,66 @@ Statistics Dashboard Window - Visual analytics for surveillance system
 import customtkinter as ctk
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+import matplotlib.style as mplstyle
+import numpy as np
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 
 
+class _BlitManager:
+    """Redraw only a chart's changing artists over a cached background (matplotlib blitting)"""
+    
+    def __init__(self, canvas, ax, artists):
+        self.canvas = canvas
+        self.ax = ax
+        self.artists = []
+        self._background = None
+        self._view = None
+        for artist in artists:
+            self.add_artist(artist)
+        
+        # Every full draw (first show, resize, limit change) re-grabs the background
+        canvas.mpl_connect('draw_event', self._on_draw)
+    
+    def add_artist(self, artist):
+        artist.set_animated(True)
+        self.artists.append(artist)
+    
+    def remove_artist(self, artist):
+        self.artists.remove(artist)
+        artist.remove()
+    
+    def _current_view(self):
+        return self.ax.get_xlim(), self.ax.get_ylim()
+    
+    def _on_draw(self, event):
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._view = self._current_view()
+        self._draw_artists()
+    
+    def _draw_artists(self):
+        for artist in self.artists:
+            self.ax.draw_artist(artist)
+    
+    def update(self):
+        """Blit the animated artists; fall back to a full redraw if the axes limits moved"""
+        if self._background is None or self._current_view() != self._view:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_artists()
+        self.canvas.blit(self.ax.bbox)
+
+
 class StatisticsDashboard:
     """Dashboard window showing surveillance statistics and charts"""
     
+    # The matplotlib style only needs applying once per process
+    _style_loaded = False
+    
     def __init__(self, parent, stats_manager):
         """Initialize dashboard window"""
         self.stats_manager = stats_manager
@@ -22,14 +74,32 @@ class StatisticsDashboard:
         self.window.title("📊 Statistics Dashboard")
         self.window.geometry("1200x800")
         
-        # Configure matplotlib style
-        plt.style.use('seaborn-v0_8-darkgrid')
+        # Configure matplotlib style (first dashboard only)
+        if not StatisticsDashboard._style_loaded:
+            mplstyle.use('seaborn-v0_8-darkgrid')
+            StatisticsDashboard._style_loaded = True
+        
+        # Pending debounced refresh (Tk after() id)
+        self._pending_refresh = None
+        
+        # Stats are aggregated off the Tk thread; at most one job in flight
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._snapshot_future = None
+        self._refresh_again = False
+        
+        # Set when a refresh was skipped because the window wasn't visible
+        self._refresh_deferred = False
+        
+        # Digest of the data each chart last rendered, so unchanged charts are skipped
+        self._chart_hashes = {}
         
         # Build UI
         self.setup_ui()
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        self.window.bind("<Map>", self._on_map, add="+")
         
         # Initial data load
-        self.refresh_dashboard()
+        self.request_refresh()
     
     def setup_ui(self):
         """Setup the dashboard UI"""
@@ -118,7 +188,7 @@ class StatisticsDashboard:
         return value_label
     
     def setup_charts_container(self):
-        """Setup scrollable container for charts"""
+        """Setup scrollable container and build every chart once"""
         # Scrollable frame
         self.charts_frame = ctk.CTkScrollableFrame(self.window, height=500)
         self.charts_frame.grid(row=2, column=0, sticky="nsew", padx=10, pady=10)
@@ -127,13 +197,171 @@ class StatisticsDashboard:
         # Configure grid
         self.charts_frame.grid_columnconfigure((0, 1), weight=1)
         
-        # Create chart placeholders
-        self.chart_alerts_time = None
-        self.chart_alerts_object = None
-        self.chart_peak_hours = None
-        self.chart_confidence = None
-        self.chart_fps = None
-        self.chart_additional_stats = None
+        # Figures, axes and artists are created here once; refresh only updates their data
+        self.setup_alerts_over_time_chart()
+        self.setup_alerts_by_object_chart()
+        self.setup_peak_hours_chart()
+        self.setup_confidence_chart()
+        self.setup_fps_chart()
+        self.setup_additional_stats_panel()
+    
+    def create_chart_frame(self, title, row, column):
+        """Create a titled frame in the charts grid"""
+        frame = ctk.CTkFrame(self.charts_frame)
+        frame.grid(row=row, column=column, padx=5, pady=5, sticky="nsew")
+        
+        # Title
+        title_label = ctk.CTkLabel(
+            frame,
+            text=title,
+            font=ctk.CTkFont(size=14, weight="bold")
+        )
+        title_label.pack(pady=5)
+        return frame
+    
+    def create_chart(self, title, row, column):
+        """Create a titled chart frame with a Figure/Axes/canvas and a 'No data' placeholder"""
+        frame = self.create_chart_frame(title, row, column)
+        
+        # Create figure
+        fig = Figure(figsize=(5, 3), dpi=100)
+        ax = fig.add_subplot(111)
+        no_data = ax.text(0.5, 0.5, 'No data available', transform=ax.transAxes,
+                          ha='center', va='center', fontsize=12)
+        
+        # Embed in tkinter
+        canvas = FigureCanvasTkAgg(fig, frame)
+        widget = canvas.get_tk_widget()
+        # Charts are display-only (no toolbar): drop the pointer/keyboard bindings so
+        # mouse motion over a chart doesn't dispatch matplotlib events. <Configure>
+        # stays bound so charts still resize; redraws only come from refresh.
+        for sequence in ("<Motion>", "<Enter>", "<Leave>", "<Key>", "<KeyRelease>",
+                         "<Button-1>", "<Button-2>", "<Button-3>",
+                         "<Double-Button-1>", "<Double-Button-2>", "<Double-Button-3>",
+                         "<ButtonRelease-1>", "<ButtonRelease-2>", "<ButtonRelease-3>",
+                         "<Button-4>", "<Button-5>"):
+            widget.unbind(sequence)
+        widget.pack(fill="both", expand=True, padx=5, pady=5)
+        return fig, ax, canvas, no_data
+    
+    def format_date_axis(self, ax):
+        """Use short, unrotated date tick labels so the figure layout never needs adjusting"""
+        locator = mdates.AutoDateLocator()
+        ax.xaxis.set_major_locator(locator)
+        ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+        ax.figure.subplots_adjust(bottom=0.2)  # Room for the date offset and axis label
+    
+    def setup_alerts_over_time_chart(self):
+        """Build alerts over time line chart"""
+        fig, ax, self._canvas_alerts_time, self._no_data_alerts_time = self.create_chart(
+            "📈 Alerts Over Time (Last 24 Hours)", 0, 0
+        )
+        self._ax_alerts_time = ax
+        self._line_alerts, = ax.plot([], [], marker='o', color='#FF5733', linewidth=2)
+        self._fill_alerts = None
+        self._blit_alerts_time = _BlitManager(
+            self._canvas_alerts_time, ax, [self._line_alerts, self._no_data_alerts_time]
+        )
+        self.format_date_axis(ax)
+        ax.set_xlabel('Time')
+        ax.set_ylabel('Alert Count')
+        ax.grid(True, alpha=0.3)
+    
+    def setup_alerts_by_object_chart(self):
+        """Build alerts by object type panel (one progress bar row per object type, no figure)"""
+        frame = self.create_chart_frame("📊 Alerts by Object Type", 0, 1)
+        
+        self._object_rows_frame = ctk.CTkFrame(frame, fg_color="transparent")
+        self._object_rows_frame.pack(fill="both", expand=True, padx=15, pady=10)
+        self._object_rows = []  # Pool of (row, label, bar); rows beyond the data are hidden
+        self._object_rows_shown = 0
+        
+        self._no_data_object = ctk.CTkLabel(
+            self._object_rows_frame,
+            text="No data available",
+            font=ctk.CTkFont(size=12)
+        )
+        self._no_data_object.pack(pady=20)
+    
+    def create_object_row(self, color):
+        """Create a pooled 'name (count)' label + progress bar row"""
+        row = ctk.CTkFrame(self._object_rows_frame, fg_color="transparent")
+        label = ctk.CTkLabel(row, text="", font=ctk.CTkFont(size=12), anchor="w")
+        label.pack(fill="x")
+        bar = ctk.CTkProgressBar(row, progress_color=color)
+        bar.pack(fill="x", pady=(0, 6))
+        return row, label, bar
+    
+    def setup_peak_hours_chart(self):
+        """Build peak alert hours bar chart"""
+        fig, ax, self._canvas_peak_hours, self._no_data_peak_hours = self.create_chart(
+            "📊 Peak Alert Hours", 1, 0
+        )
+        self._ax_peak_hours = ax
+        self._bars_hours = ax.bar(range(24), [0] * 24, color='#4ECDC4', alpha=0.7)
+        self._peak_hours = np.zeros(24, dtype=bool)
+        ax.set_xlabel('Hour of Day')
+        ax.set_ylabel('Alert Count')
+        ax.set_xticks(range(0, 24, 2))
+        ax.grid(True, alpha=0.3, axis='y')
+    
+    def setup_confidence_chart(self):
+        """Build detection confidence histogram (fixed 0-100% bins, heights updated on refresh)"""
+        fig, ax, self._canvas_confidence, self._no_data_confidence = self.create_chart(
+            "📊 Detection Confidence Distribution", 1, 1
+        )
+        self._ax_confidence = ax
+        self._conf_bin_edges = np.linspace(0, 100, 21)
+        self._hist_conf = ax.bar(self._conf_bin_edges[:-1], np.zeros(20), width=5, align='edge',
+                                 color='#45B7D1', alpha=0.7, edgecolor='black')
+        self._conf_avg_line = ax.axvline(0, color='red', linestyle='--', linewidth=2, label="Avg")
+        self._conf_legend = ax.legend()
+        ax.set_xlabel('Confidence (%)')
+        ax.set_ylabel('Frequency')
+        ax.grid(True, alpha=0.3, axis='y')
+    
+    def setup_fps_chart(self):
+        """Build FPS over time chart"""
+        fig, ax, self._canvas_fps, self._no_data_fps = self.create_chart(
+            "⚡ System FPS Performance", 2, 0
+        )
+        self._ax_fps = ax
+        self._line_fps, = ax.plot([], [], color='#98D8C8', linewidth=2)
+        self._fps_avg_line = ax.axhline(0, color='orange', linestyle='--', linewidth=1, label="Avg")
+        self._fps_legend = ax.legend()
+        self._blit_fps = _BlitManager(
+            self._canvas_fps, ax,
+            [self._line_fps, self._fps_avg_line, self._fps_legend, self._no_data_fps]
+        )
+        self.format_date_axis(ax)
+        ax.set_xlabel('Time')
+        ax.set_ylabel('FPS')
+        ax.grid(True, alpha=0.3)
+    
+    def setup_additional_stats_panel(self):
+        """Build additional statistics text panel"""
+        frame = ctk.CTkFrame(self.charts_frame)
+        frame.grid(row=2, column=1, padx=5, pady=5, sticky="nsew")
+        
+        # Title
+        title = ctk.CTkLabel(
+            frame,
+            text="📋 Additional Statistics",
+            font=ctk.CTkFont(size=14, weight="bold")
+        )
+        title.pack(pady=5)
+        
+        # Create text display
+        text_frame = ctk.CTkScrollableFrame(frame, height=200)
+        text_frame.pack(fill="both", expand=True, padx=5, pady=5)
+        
+        self._stats_label = ctk.CTkLabel(
+            text_frame,
+            text="",
+            font=ctk.CTkFont(family="Courier", size=12),  # Monospace keeps the columns aligned
+            justify="left"
+        )
+        self._stats_label.pack(anchor="w", padx=10, pady=10)
     
     def setup_footer(self):
         """Setup footer with control buttons"""
@@ -144,7 +372,7 @@ class StatisticsDashboard:
         btn_refresh = ctk.CTkButton(
             footer,
             text="🔄 Refresh",
-            command=self.refresh_dashboard,
+            command=self.request_refresh,
             fg_color="green",
             hover_color="darkgreen",
             width=120
@@ -185,29 +413,86 @@ class StatisticsDashboard:
         btn_close = ctk.CTkButton(
             footer,
             text="❌ Close",
-            command=self.window.destroy,
+            command=self.close,
             fg_color="red",
             hover_color="darkred",
             width=120
         )
         btn_close.pack(side="right", padx=5)
     
-    def refresh_dashboard(self):
-        """Refresh all dashboard data and charts"""
-        # Update summary cards
-        self.update_summary_cards()
-        
-        # Clear existing charts
-        for widget in self.charts_frame.winfo_children():
-            widget.destroy()
+    def request_refresh(self):
+        """Schedule a refresh; requests arriving within 150 ms are coalesced into one"""
+        if self._pending_refresh is None:
+            self._pending_refresh = self.window.after(150, self._do_refresh)
+    
+    def _do_refresh(self):
+        """Start aggregating the stats snapshot in the background"""
+        self._pending_refresh = None
+        if not self.window.winfo_viewable() or self.window.state() == 'iconic':
+            # Nobody can see the charts; catch up once the window is mapped again
+            self._refresh_deferred = True
+            return
+        if self._snapshot_future is not None:
+            # A job is already running; refresh again once it lands
+            self._refresh_again = True
+            return
+        self._snapshot_future = self._executor.submit(self.stats_manager.get_snapshot, 24)
+        self.window.after(20, self._poll_snapshot)
+    
+    def _on_map(self, event):
+        """Run the refresh skipped while the window was hidden or minimized"""
+        if event.widget is self.window and self._refresh_deferred:
+            self._refresh_deferred = False
+            self.request_refresh()
+    
+    def _poll_snapshot(self):
+        """Wait (on the Tk thread) for the background snapshot, then render it when idle"""
+        if not self.window.winfo_exists():
+            return
+        if not self._snapshot_future.done():
+            self.window.after(20, self._poll_snapshot)
+            return
+        
+        future, self._snapshot_future = self._snapshot_future, None
+        try:
+            self.window.after_idle(self._render_all, future.result())
+        except Exception as e:
+            print(f"❌ Dashboard refresh failed: {e}")
+        
+        if self._refresh_again:
+            self._refresh_again = False
+            self.request_refresh()
+    
+    def close(self):
+        """Cancel any pending refresh and close the window"""
+        if self._pending_refresh is not None:
+            self.window.after_cancel(self._pending_refresh)
+            self._pending_refresh = None
+        self._executor.shutdown(wait=False)
+        self.window.destroy()
+    
+    def _render_all(self, snap):
+        """Refresh all dashboard data and charts from a stats snapshot"""
+        if not self.window.winfo_exists():
+            return
         
-        # Create new charts
-        self.create_alerts_over_time_chart()
-        self.create_alerts_by_object_chart()
-        self.create_peak_hours_chart()
-        self.create_confidence_chart()
-        self.create_fps_chart()
-        self.create_additional_stats_panel()
+        # Update summary cards
+        self.update_summary_cards(snap)
+        
+        # Update chart data in place, skipping charts whose data hasn't changed
+        if self._data_changed('alerts_over_time', *snap['alerts_over_time']):
+            self.update_alerts_over_time_chart(snap)
+        if self._data_changed('alerts_by_object', snap['alerts_by_object']):
+            self.update_alerts_by_object_chart(snap)
+        if self._data_changed('alerts_by_hour', snap['alerts_by_hour']):
+            self.update_peak_hours_chart(snap)
+        conf_stats = snap['confidence']
+        if self._data_changed('confidence', conf_stats['average'],
+                              np.asarray(conf_stats['distribution'])):
+            self.update_confidence_chart(snap)
+        if self._data_changed('fps', snap['fps']['average'], *snap['fps_history']):
+            self.update_fps_chart(snap)
+        self.update_additional_stats_panel(snap)
         
         # Update timestamp
         self.lbl_updated.configure(
@@ -216,240 +501,189 @@ class StatisticsDashboard:
         
         print("📊 Dashboard refreshed")
     
-    def update_summary_cards(self):
+    def _data_changed(self, name, *parts):
+        """Return True (and remember the new digest) if a chart's input data differs from its last render"""
+        digest = hashlib.blake2b(digest_size=8)
+        for part in parts:
+            digest.update(part.tobytes() if isinstance(part, np.ndarray) else repr(part).encode())
+        digest = digest.digest()
+        if self._chart_hashes.get(name) == digest:
+            return False
+        self._chart_hashes[name] = digest
+        return True
+    
+    def update_summary_cards(self, snap):
         """Update summary card values"""
-        stats = self.stats_manager.get_summary_stats()
-        
-        self.card_total_alerts.configure(text=str(stats['total_alerts']))
-        self.card_today_alerts.configure(text=str(stats['alerts_today']))
-        self.card_objects.configure(text=str(stats['current_objects_tracked']))
-        self.card_uptime.configure(text=stats['uptime'])
+        stats = snap['summary']
+        
+        # Only touch cards whose value changed, then let Tk lay them out in one pass
+        changed = False
+        for card, value in ((self.card_total_alerts, str(stats['total_alerts'])),
+                            (self.card_today_alerts, str(stats['alerts_today'])),
+                            (self.card_objects, str(stats['current_objects_tracked'])),
+                            (self.card_uptime, stats['uptime'])):
+            if card.cget("text") != value:
+                card.configure(text=value)
+                changed = True
+        if changed:
+            self.window.update_idletasks()
     
-    def create_alerts_over_time_chart(self):
-        """Create alerts over time line chart"""
-        frame = ctk.CTkFrame(self.charts_frame)
-        frame.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
-        
-        # Title
-        title = ctk.CTkLabel(
-            frame,
-            text="📈 Alerts Over Time (Last 24 Hours)",
-            font=ctk.CTkFont(size=14, weight="bold")
-        )
-        title.pack(pady=5)
-        
-        # Create figure
-        fig = Figure(figsize=(5, 3), dpi=100)
-        ax = fig.add_subplot(111)
-        
-        # Get data
-        alerts_data = self.stats_manager.get_alerts_over_time(hours=24)
-        
-        if alerts_data:
-            times = [d['time'] for d in alerts_data]
-            counts = [d['count'] for d in alerts_data]
-            
-            ax.plot(times, counts, marker='o', color='#FF5733', linewidth=2)
-            ax.fill_between(times, counts, alpha=0.3, color='#FF5733')
-            ax.set_xlabel('Time')
-            ax.set_ylabel('Alert Count')
-            ax.grid(True, alpha=0.3)
-            
-            # Format x-axis
-            fig.autofmt_xdate()
-        else:
-            ax.text(0.5, 0.5, 'No data available', 
-                   ha='center', va='center', fontsize=12)
-        
-        # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
+    def update_alerts_over_time_chart(self, snap):
+        """Update alerts over time line chart"""
+        ax = self._ax_alerts_time
+        
+        # Get data (NumPy arrays straight from the stats manager)
+        times, counts = snap['alerts_over_time']
+        has_data = len(times) > 0
+        
+        self._line_alerts.set_data(times, counts)
+        if self._fill_alerts is not None:
+            self._blit_alerts_time.remove_artist(self._fill_alerts)
+            self._fill_alerts = None
+        if has_data:
+            self._fill_alerts = ax.fill_between(times, counts, alpha=0.3, color='#FF5733')
+            self._blit_alerts_time.add_artist(self._fill_alerts)
+        
+        self._show_data(ax, self._no_data_alerts_time, has_data, self._line_alerts)
+        self._blit_alerts_time.update()
     
-    def create_alerts_by_object_chart(self):
-        """Create alerts by object type pie chart"""
-        frame = ctk.CTkFrame(self.charts_frame)
-        frame.grid(row=0, column=1, padx=5, pady=5, sticky="nsew")
-        
-        # Title
-        title = ctk.CTkLabel(
-            frame,
-            text="🥧 Alerts by Object Type",
-            font=ctk.CTkFont(size=14, weight="bold")
-        )
-        title.pack(pady=5)
-        
-        # Create figure
-        fig = Figure(figsize=(5, 3), dpi=100)
-        ax = fig.add_subplot(111)
-        
+    def update_alerts_by_object_chart(self, snap):
+        """Update alerts by object type rows (largest first, share of all alerts)"""
         # Get data
-        object_counts = self.stats_manager.get_alerts_by_object()
-        
-        if object_counts:
-            labels = list(object_counts.keys())
-            sizes = list(object_counts.values())
-            colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', '#98D8C8']
-            
-            ax.pie(sizes, labels=labels, autopct='%1.1f%%', colors=colors, startangle=90)
-            ax.axis('equal')
+        object_counts = snap['alerts_by_object']
+        items = sorted(object_counts.items(), key=lambda item: item[1], reverse=True)
+        total = sum(object_counts.values())
+        colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', '#98D8C8']
+        
+        # Grow the pool only when a new object type appears
+        while len(self._object_rows) < len(items):
+            self._object_rows.append(self.create_object_row(colors[len(self._object_rows) % len(colors)]))
+        
+        for (name, count), (row, label, bar) in zip(items, self._object_rows):
+            label.configure(text=f"{name} ({count}) - {count / total * 100:.1f}%")
+            bar.set(count / total)
+        
+        # Show/hide rows only when the number of object types changes
+        for row, _, _ in self._object_rows[len(items):self._object_rows_shown]:
+            row.pack_forget()
+        for row, _, _ in self._object_rows[self._object_rows_shown:len(items)]:
+            row.pack(fill="x")
+        self._object_rows_shown = len(items)
+        
+        if items:
+            self._no_data_object.pack_forget()
         else:
-            ax.text(0.5, 0.5, 'No data available', 
-                   ha='center', va='center', fontsize=12)
-        
-        # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
+            self._no_data_object.pack(pady=20)
     
-    def create_peak_hours_chart(self):
-        """Create peak alert hours bar chart"""
-        frame = ctk.CTkFrame(self.charts_frame)
-        frame.grid(row=1, column=0, padx=5, pady=5, sticky="nsew")
-        
-        # Title
-        title = ctk.CTkLabel(
-            frame,
-            text="📊 Peak Alert Hours",
-            font=ctk.CTkFont(size=14, weight="bold")
-        )
-        title.pack(pady=5)
-        
-        # Create figure
-        fig = Figure(figsize=(5, 3), dpi=100)
-        ax = fig.add_subplot(111)
-        
+    def update_peak_hours_chart(self, snap):
+        """Update peak alert hours bar chart"""
         # Get data
-        hourly_data = self.stats_manager.get_alerts_by_hour()
-        
-        if hourly_data:
-            hours = list(hourly_data.keys())
-            counts = list(hourly_data.values())
-            
-            bars = ax.bar(hours, counts, color='#4ECDC4', alpha=0.7)
-            
-            # Highlight peak hour
-            max_count = max(counts)
-            for bar, count in zip(bars, counts):
-                if count == max_count:
-                    bar.set_color('#FF6B6B')
-            
-            ax.set_xlabel('Hour of Day')
-            ax.set_ylabel('Alert Count')
-            ax.set_xticks(range(0, 24, 2))
-            ax.grid(True, alpha=0.3, axis='y')
-        else:
-            ax.text(0.5, 0.5, 'No data available', 
-                   ha='center', va='center', fontsize=12)
-        
-        # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
+        hourly_data = snap['alerts_by_hour']
+        counts = np.fromiter((hourly_data.get(hour, 0) for hour in range(24)), dtype=np.int32, count=24)
+        for bar, count in zip(self._bars_hours, counts.tolist()):
+            bar.set_height(count)
+        
+        # Highlight peak hour(s); only bars whose highlight changed are recolored
+        max_count = int(counts.max())
+        is_peak = (counts == max_count) & (max_count > 0)
+        for hour in np.flatnonzero(is_peak != self._peak_hours):
+            self._bars_hours[hour].set_color('#FF6B6B' if is_peak[hour] else '#4ECDC4')
+        self._peak_hours = is_peak
+        
+        self._ax_peak_hours.set_ylim(0, max(max_count, 1) * 1.05)
+        self._show_data(self._ax_peak_hours, self._no_data_peak_hours, max_count > 0, *self._bars_hours)
+        self._canvas_peak_hours.draw_idle()
     
-    def create_confidence_chart(self):
-        """Create detection confidence histogram"""
-        frame = ctk.CTkFrame(self.charts_frame)
-        frame.grid(row=1, column=1, padx=5, pady=5, sticky="nsew")
-        
-        # Title
-        title = ctk.CTkLabel(
-            frame,
-            text="📊 Detection Confidence Distribution",
-            font=ctk.CTkFont(size=14, weight="bold")
-        )
-        title.pack(pady=5)
-        
-        # Create figure
-        fig = Figure(figsize=(5, 3), dpi=100)
-        ax = fig.add_subplot(111)
-        
+    def update_confidence_chart(self, snap):
+        """Update detection confidence histogram"""
         # Get data
-        conf_stats = self.stats_manager.get_confidence_stats()
-        
-        if conf_stats['distribution']:
-            # Convert to percentage
-            confidences = [c * 100 for c in conf_stats['distribution']]
-            
-            ax.hist(confidences, bins=20, color='#45B7D1', alpha=0.7, edgecolor='black')
-            ax.axvline(conf_stats['average'], color='red', linestyle='--', linewidth=2, label=f"Avg: {conf_stats['average']:.1f}%")
-            ax.set_xlabel('Confidence (%)')
-            ax.set_ylabel('Frequency')
-            ax.legend()
-            ax.grid(True, alpha=0.3, axis='y')
-        else:
-            ax.text(0.5, 0.5, 'No data available', 
-                   ha='center', va='center', fontsize=12)
-        
-        # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
+        conf_stats = snap['confidence']
+        
+        # Convert to percentage
+        confidences = np.asarray(conf_stats['distribution'], dtype=np.float32) * 100
+        heights, _ = np.histogram(confidences, bins=self._conf_bin_edges)
+        for bar, height in zip(self._hist_conf, heights):
+            bar.set_height(height)
+        
+        self._conf_avg_line.set_xdata([conf_stats['average'], conf_stats['average']])
+        self._conf_legend.get_texts()[0].set_text(f"Avg: {conf_stats['average']:.1f}%")
+        self._ax_confidence.set_ylim(0, max(heights.max(), 1) * 1.05)
+        
+        has_data = bool(conf_stats['distribution'])
+        self._show_data(self._ax_confidence, self._no_data_confidence, has_data,
+                        self._conf_avg_line, self._conf_legend, *self._hist_conf)
+        self._canvas_confidence.draw_idle()
     
-    def create_fps_chart(self):
-        """Create FPS over time chart"""
-        frame = ctk.CTkFrame(self.charts_frame)
-        frame.grid(row=2, column=0, padx=5, pady=5, sticky="nsew")
-        
-        # Title
-        title = ctk.CTkLabel(
-            frame,
-            text="⚡ System FPS Performance",
-            font=ctk.CTkFont(size=14, weight="bold")
-        )
-        title.pack(pady=5)
-        
-        # Create figure
-        fig = Figure(figsize=(5, 3), dpi=100)
-        ax = fig.add_subplot(111)
-        
+    def update_fps_chart(self, snap):
+        """Update FPS over time chart"""
         # Get data
-        fps_stats = self.stats_manager.get_fps_stats()
-        
-        if fps_stats['history']:
-            times = [d['timestamp'] for d in fps_stats['history']]
-            fps_values = [d['fps'] for d in fps_stats['history']]
-            
-            ax.plot(times, fps_values, color='#98D8C8', linewidth=2)
-            ax.axhline(fps_stats['average'], color='orange', linestyle='--', linewidth=1, label=f"Avg: {fps_stats['average']} FPS")
-            ax.set_xlabel('Time')
-            ax.set_ylabel('FPS')
-            ax.legend()
-            ax.grid(True, alpha=0.3)
-            
-            # Format x-axis
-            fig.autofmt_xdate()
-        else:
-            ax.text(0.5, 0.5, 'No data available', 
-                   ha='center', va='center', fontsize=12)
+        fps_stats = snap['fps']
+        times, fps_values = snap['fps_history']
         
-        # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
-    
-    def create_additional_stats_panel(self):
-        """Create additional statistics text panel"""
-        frame = ctk.CTkFrame(self.charts_frame)
-        frame.grid(row=2, column=1, padx=5, pady=5, sticky="nsew")
-        
-        # Title
-        title = ctk.CTkLabel(
-            frame,
-            text="📋 Additional Statistics",
-            font=ctk.CTkFont(size=14, weight="bold")
-        )
-        title.pack(pady=5)
+        self._line_fps.set_data(times, fps_values)
+        self._fps_avg_line.set_ydata([fps_stats['average'], fps_stats['average']])
+        self._fps_legend.get_texts()[0].set_text(f"Avg: {fps_stats['average']} FPS")
         
+        has_data = len(times) > 0
+        self._show_data(self._ax_fps, self._no_data_fps, has_data,
+                        self._line_fps, self._fps_avg_line, self._fps_legend)
+        self._blit_fps.update()
+    
+    def _clear_all_artists(self):
+        """Empty every chart in place (figures and widgets are kept) and show the 'No data' placeholders"""
+        self._chart_hashes.clear()  # Next refresh redraws everything
+        self._line_alerts.set_data([], [])
+        if self._fill_alerts is not None:
+            self._blit_alerts_time.remove_artist(self._fill_alerts)
+            self._fill_alerts = None
+        self._show_data(self._ax_alerts_time, self._no_data_alerts_time, False, self._line_alerts)
+        
+        for row, _, _ in self._object_rows[:self._object_rows_shown]:
+            row.pack_forget()
+        self._object_rows_shown = 0
+        self._no_data_object.pack(pady=20)
+        
+        for bar in self._bars_hours:
+            bar.set_height(0)
+            bar.set_color('#4ECDC4')
+        self._peak_hours = np.zeros(24, dtype=bool)
+        self._show_data(self._ax_peak_hours, self._no_data_peak_hours, False, *self._bars_hours)
+        
+        for bar in self._hist_conf:
+            bar.set_height(0)
+        self._show_data(self._ax_confidence, self._no_data_confidence, False,
+                        self._conf_avg_line, self._conf_legend, *self._hist_conf)
+        
+        self._line_fps.set_data([], [])
+        self._show_data(self._ax_fps, self._no_data_fps, False,
+                        self._line_fps, self._fps_avg_line, self._fps_legend)
+        
+        for canvas in (self._canvas_alerts_time, self._canvas_peak_hours,
+                       self._canvas_confidence, self._canvas_fps):
+            canvas.draw_idle()
+    
+    def _show_data(self, ax, no_data_text, has_data, *artists):
+        """Toggle between a chart's data artists and its 'No data' placeholder, rescaling to the data"""
+        for artist in artists:
+            artist.set_visible(has_data)
+        no_data_text.set_visible(not has_data)
+        if has_data:
+            ax.relim(visible_only=True)
+            ax.autoscale_view()
+    
+    def update_additional_stats_panel(self, snap):
+        """Update additional statistics text panel"""
+        stats_text = self._format_stats(snap)
+        if self._data_changed('stats_text', stats_text):
+            self._stats_label.configure(text=stats_text)
+    
+    def _format_stats(self, snap):
+        """Format the additional statistics text from a stats snapshot"""
         # Get data
-        stats = self.stats_manager.get_summary_stats()
-        fps_stats = self.stats_manager.get_fps_stats()
-        conf_stats = self.stats_manager.get_confidence_stats()
-        peak_time = self.stats_manager.get_peak_alert_time()
-        
-        # Create text display
-        text_frame = ctk.CTkScrollableFrame(frame, height=200)
-        text_frame.pack(fill="both", expand=True, padx=5, pady=5)
+        stats = snap['summary']
+        fps_stats = snap['fps']
+        conf_stats = snap['confidence']
+        peak_time = snap['peak_time']
         
         stats_text = f"""
 📊 System Performance:
@@ -474,13 +708,7 @@ class StatisticsDashboard:
    • Uptime: {stats['uptime']}
         """
         
-        stats_label = ctk.CTkLabel(
-            text_frame,
-            text=stats_text.strip(),
-            font=ctk.CTkFont(size=12),
-            justify="left"
-        )
-        stats_label.pack(anchor="w", padx=10, pady=10)
+        return stats_text.strip()
     
     def export_data(self):
         """Export statistics to CSV"""
@@ -497,5 +725,9 @@ class StatisticsDashboard:
         from tkinter import messagebox
         if messagebox.askyesno("Confirm Reset", "Are you sure you want to reset all statistics?"):
             self.stats_manager.reset_stats()
-            self.refresh_dashboard()
+            self._clear_all_artists()
+            self.lbl_updated.configure(
+                text=f"Last Updated: {datetime.now().strftime('%H:%M:%S')}"
+            )
+            self.request_refresh()  # Summary cards and stats text
             messagebox.showinfo("Reset Complete", "All statistics have been reset")
@@ -4,20 +4,72 @@ Professional GUI with camera feed, controls, and data viewing
 """
 
 import customtkinter as ctk
+import tkinter as tk
 from tkinter import messagebox
 import cv2
+import numpy as np
 from PIL import Image, ImageTk
 import threading
+import queue
 import time
 from core.surveillance_engine import SurveillanceEngine
 import config
 import os
 from datetime import datetime
+from collections import deque, OrderedDict
 
 # Set appearance mode and color theme
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# Shared CTkFont instances keyed by (size, weight), created on first use (needs a Tk root)
+_FONT_CACHE = {}
+
+
+def _font(size=None, weight=None):
+    """Get a cached CTkFont so labels with the same style share one Tk font"""
+    key = (size, weight)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = _FONT_CACHE[key] = ctk.CTkFont(size=size, weight=weight)
+    return font
+
+
+# Display-ready PhotoImages for the image viewers (LRU, so revisiting an image skips the decode/resize)
+_PHOTO_CACHE_SIZE = 32
+_ALERT_PHOTO_CACHE = OrderedDict()  # Alert snapshots keyed by filename
+
+
+def _cache_get(cache, key):
+    """Look up an LRU photo cache entry, marking it most recently used"""
+    photo = cache.get(key)
+    if photo is not None:
+        cache.move_to_end(key)
+    return photo
+
+
+def _cache_put(cache, key, photo):
+    """Add a photo to an LRU cache, evicting the oldest past _PHOTO_CACHE_SIZE"""
+    cache[key] = photo
+    if len(cache) > _PHOTO_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _frame_to_photo(frame, max_w, max_h):
+    """Scale a BGR frame to fit max_w x max_h and convert it to an ImageTk.PhotoImage"""
+    h, w = frame.shape[:2]
+    scale = min(max_w/w, max_h/h)
+    if scale >= 1.0:
+        # Already fits: show at native size rather than upscaling
+        new_w, new_h, frame_resized = w, h, frame
+    else:
+        new_w, new_h = int(w*scale), int(h*scale)
+        frame_resized = cv2.resize(frame, (new_w, new_h))
+    
+    # Resize in BGR, then let PIL's BGR raw decoder do the channel swap (no cvtColor pass)
+    img = Image.frombuffer("RGB", (new_w, new_h), frame_resized, "raw", "BGR", 0, 1)
+    return ImageTk.PhotoImage(image=img)
+
 
 class SurveillanceGUI:
     """Main GUI Application"""
@@ -31,23 +83,61 @@ class SurveillanceGUI:
         # Initialize surveillance engine
         self.engine = SurveillanceEngine()
         
-        # GUI state
-        self.video_running = False
+        # GUI state: one video thread for the app's lifetime, paused/resumed via video_running
+        self._run_event = threading.Event()
+        self._shutdown = threading.Event()
+        self._paused = threading.Event()  # Set while the video thread is parked between runs
+        self._paused.set()
         self.video_thread = None
         self.current_display_frame = None
         
-        # Setup callbacks
-        self.engine.on_status_update = self.update_status_display
-        self.engine.on_alert = self.on_alert_callback
+        # Display geometry for the current frame shape, with reusable resize/RGB
+        # buffers and PPM header (recomputed only when the frame shape changes)
+        self._disp_shape = None
+        self._disp_size = None
+        self._disp_buf = None
+        self._rgb_buf = None
+        self._ppm_header = None
+        
+        # Newest display-ready frame from the video thread; the Tk thread polls it
+        self._latest_frame = queue.Queue(maxsize=1)
+        self._window_visible = True  # False while minimized: frames are processed but not converted for display
+        self._drain_id = None
+        
+        # Log lines waiting to be written to the log window (flushed in batches)
+        self._log_queue = deque()
+        self._log_flush_id = None
+        
+        # Last text shown in the status labels/bar, so unchanged updates skip configure()
+        self._last_status = {}
+        
+        # Pending threshold-slider commit (debounced so a drag applies only the final value)
+        self._threshold_job = None
+        
+        # Engine callbacks fire on the video thread: they only queue the update,
+        # and _drain_frames applies it on the Tk thread
+        self._pending_status = None
+        self._pending_alerts = deque()
+        self.engine.on_status_update = self._queue_status_update
+        self.engine.on_alert = self._pending_alerts.append
         
         # Build GUI
         self.setup_ui()
         
-        # Initialize system
-        self.initialize_system()
+        # Initialize system once the window has painted (model load and camera open are slow)
+        self.root.after(100, self.initialize_system)
         
         # Bind close event
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        
+        # Track whether the main window is minimized
+        self.root.bind("<Map>", self._on_root_visibility, add="+")
+        self.root.bind("<Unmap>", self._on_root_visibility, add="+")
+        
+        # Start the video thread (paused until video is started) and show the frames it produces
+        self.video_thread = threading.Thread(target=self.video_loop, daemon=True)
+        self.video_thread.start()
+        self._drain_frames()
     
     def setup_ui(self):
         """Setup the complete UI layout"""
@@ -71,19 +161,20 @@ class SurveillanceGUI:
         title_label = ctk.CTkLabel(
             camera_frame,
             text="📹 CAMERA FEED",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=_font(20, "bold")
         )
         title_label.pack(pady=10)
         
-        # Camera display label
-        self.camera_label = ctk.CTkLabel(camera_frame, text="")
+        # Camera display label, backed by one Tk photo whose pixels are replaced each frame
+        self._camera_photo = tk.PhotoImage(master=self.root)
+        self.camera_label = ctk.CTkLabel(camera_frame, text="", image=self._camera_photo)
         self.camera_label.pack(expand=True, fill="both", padx=10, pady=10)
         
         # Status bar at bottom
         self.status_bar = ctk.CTkLabel(
             camera_frame,
             text="⚪ System Ready",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             fg_color=("gray80", "gray20"),
             corner_radius=5
         )
@@ -98,7 +189,7 @@ class SurveillanceGUI:
         title = ctk.CTkLabel(
             control_frame,
             text="🎮 CONTROL PANEL",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_font(18, "bold")
         )
         title.pack(pady=10)
         
@@ -129,7 +220,7 @@ class SurveillanceGUI:
         frame = ctk.CTkFrame(parent)
         frame.pack(fill="x", padx=5, pady=10)
         
-        label = ctk.CTkLabel(frame, text="Main Controls", font=ctk.CTkFont(size=14, weight="bold"))
+        label = ctk.CTkLabel(frame, text="Main Controls", font=_font(14, "bold"))
         label.pack(pady=5)
         
         # Start/Stop Video
@@ -201,7 +292,7 @@ class SurveillanceGUI:
         frame = ctk.CTkFrame(parent)
         frame.pack(fill="x", padx=5, pady=10)
         
-        label = ctk.CTkLabel(frame, text="ROI Mode", font=ctk.CTkFont(size=14, weight="bold"))
+        label = ctk.CTkLabel(frame, text="ROI Mode", font=_font(14, "bold"))
         label.pack(pady=5)
         
         # Radio buttons for mode
@@ -228,7 +319,7 @@ class SurveillanceGUI:
         frame = ctk.CTkFrame(parent)
         frame.pack(fill="x", padx=5, pady=10)
         
-        label = ctk.CTkLabel(frame, text="📊 Status", font=ctk.CTkFont(size=14, weight="bold"))
+        label = ctk.CTkLabel(frame, text="📊 Status", font=_font(14, "bold"))
         label.pack(pady=5)
         
         # Status labels
@@ -249,7 +340,7 @@ class SurveillanceGUI:
         frame = ctk.CTkFrame(parent)
         frame.pack(fill="x", padx=5, pady=10)
         
-        label = ctk.CTkLabel(frame, text="📁 View Data", font=ctk.CTkFont(size=14, weight="bold"))
+        label = ctk.CTkLabel(frame, text="📁 View Data", font=_font(14, "bold"))
         label.pack(pady=5)
         
         # View Captured Images
@@ -307,7 +398,7 @@ class SurveillanceGUI:
         frame = ctk.CTkFrame(parent)
         frame.pack(fill="x", padx=5, pady=10)
         
-        label = ctk.CTkLabel(frame, text="⚙️ Settings", font=ctk.CTkFont(size=14, weight="bold"))
+        label = ctk.CTkLabel(frame, text="⚙️ Settings", font=_font(14, "bold"))
         label.pack(pady=5)
         
         # Alert Threshold
@@ -346,7 +437,7 @@ class SurveillanceGUI:
         frame = ctk.CTkFrame(parent)
         frame.pack(fill="both", expand=True, padx=5, pady=10)
         
-        label = ctk.CTkLabel(frame, text="📝 Log", font=ctk.CTkFont(size=14, weight="bold"))
+        label = ctk.CTkLabel(frame, text="📝 Log", font=_font(14, "bold"))
         label.pack(pady=5)
         
         self.log_text = ctk.CTkTextbox(frame, height=150, state="disabled")
@@ -354,11 +445,14 @@ class SurveillanceGUI:
         
         # Add initial log
         self.add_log("System initialized. Ready to start.")
+        self._flush_logs()
     
     # ===== FUNCTIONALITY METHODS =====
     
     def initialize_system(self):
         """Initialize the surveillance system"""
+        self.update_status_bar("⏳ Loading model...", "orange")
+        self.root.update_idletasks()
         self.add_log("Loading model...")
         if self.engine.load_model():
             self.add_log("✓ Model loaded successfully")
@@ -371,6 +465,7 @@ class SurveillanceGUI:
         if self.engine.initialize_camera():
             self.add_log("✓ Camera initialized")
             self.btn_start_video.configure(state="normal")
+            self.update_status_bar("⚪ System Ready", ctk.ThemeManager.theme["CTkLabel"]["text_color"])
         else:
             self.add_log("✗ Failed to initialize camera")
             messagebox.showerror("Error", "Failed to open camera")
@@ -384,72 +479,151 @@ class SurveillanceGUI:
     
     def start_video(self):
         """Start video feed"""
+        self.engine.resume_pipeline()
         self.video_running = True
         self.btn_start_video.configure(text="⏸️ Stop Video Feed", fg_color="orange", hover_color="darkorange")
         self.btn_capture.configure(state="normal")
         # Don't enable ROI selection until a frame is captured
         # self.btn_select_roi.configure(state="normal")
         self.add_log("Video feed started")
-        
-        # Start video thread
-        self.video_thread = threading.Thread(target=self.video_loop, daemon=True)
-        self.video_thread.start()
     
     def stop_video(self):
         """Stop video feed"""
         self.video_running = False
+        self.engine.pause_pipeline()  # No capture or tracking while nothing is displayed
         self.btn_start_video.configure(text="▶️ Start Video Feed", fg_color="green", hover_color="darkgreen")
         self.btn_capture.configure(state="disabled")
         if not self.engine.is_monitoring:
             self.btn_select_roi.configure(state="disabled")
         self.add_log("Video feed stopped")
     
+    @property
+    def video_running(self):
+        """Whether the video thread is producing frames (backed by the Event it waits on)"""
+        return self._run_event.is_set()
+    
+    @video_running.setter
+    def video_running(self, running):
+        if running:
+            self._paused.clear()  # Stale until the thread parks again
+            self._run_event.set()
+        else:
+            self._run_event.clear()
+    
     def video_loop(self):
-        """Main video processing loop"""
-        while self.video_running:
-            if self.engine.is_monitoring:
-                # Process frame with tracking
-                success, frame, any_alert = self.engine.process_frame()
-                if success:
-                    self.update_camera_display(frame)
+        """Main video processing loop (video thread): produce display-ready frames for the Tk thread"""
+        frame_interval = 1.0 / config.DISPLAY_FPS
+        
+        # Bind per-frame lookups once; is_monitoring is re-read every frame
+        engine = self.engine
+        process_frame, get_frame = engine.process_frame, engine.get_frame
+        frame_to_ppm, publish = self._frame_to_ppm, self._publish_frame
+        perf_counter, sleep = time.perf_counter, time.sleep
+        run_event, shutdown, paused = self._run_event, self._shutdown, self._paused
+        
+        while True:
+            # Paused: acknowledge, then block until video is (re)started or the app closes
+            paused.set()
+            run_event.wait()
+            if shutdown.is_set():
+                return
+            next_frame = last_shown = perf_counter()
+            
+            while run_event.is_set() and not shutdown.is_set():
+                if engine.is_monitoring:
+                    # Process frame with tracking
+                    success, frame, any_alert = process_frame()
+                else:
+                    # Just display current frame
+                    success, frame = get_frame()
+                    any_alert = None  # Status bar is left alone outside monitoring
+            
+                if success and frame is not None:
+                    # Behind the pipeline (another tracked frame is already waiting) and the
+                    # display was refreshed within this interval: skip this frame's display work
+                    now = perf_counter()
+                    if any_alert is not None and engine.pending_frames() and now - last_shown < frame_interval:
+                        continue
+                    last_shown = now
                     
-                    # Update status bar
-                    if any_alert:
-                        self.update_status_bar("🚨 ALERT - Object Missing!", "red")
-                    else:
-                        self.update_status_bar("✅ All Secured - Monitoring", "green")
-            else:
-                # Just display current frame
-                success, frame = self.engine.get_frame()
-                if success:
-                    self.update_camera_display(frame)
+                    # Minimized: keep processing (alerts still fire) but skip the display conversion
+                    publish((frame_to_ppm(frame) if self._window_visible else None, frame, any_alert))
             
-            time.sleep(0.03)  # ~30 FPS
+                # Sleep only for what's left of this frame's budget (processing time
+                # counts against it); when behind, restart the schedule instead of bursting
+                next_frame += frame_interval
+                delay = next_frame - perf_counter()
+                if delay > 0:
+                    sleep(delay)
+                else:
+                    next_frame = perf_counter()
     
-    def update_camera_display(self, frame):
-        """Update the camera display with a frame"""
-        if frame is None:
-            return
+    def _publish_frame(self, item):
+        """Hand the newest frame to the Tk thread, replacing one it hasn't shown yet"""
+        try:
+            self._latest_frame.get_nowait()
+        except queue.Empty:
+            pass
+        self._latest_frame.put_nowait(item)  # Only one producer, so the slot is free
+    
+    def _drain_frames(self):
+        """Show the newest frame and engine updates from the video thread (Tk thread, rescheduled every frame interval)"""
+        status, self._pending_status = self._pending_status, None
+        if status is not None:
+            self.update_status_display(status)
+        while self._pending_alerts:
+            self.on_alert_callback(self._pending_alerts.popleft())
         
-        # Convert BGR to RGB
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        try:
+            ppm, frame, any_alert = self._latest_frame.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            if ppm is not None:
+                self.update_camera_display(ppm, frame)
+            
+            # Update status bar
+            if any_alert:
+                self.update_status_bar("🚨 ALERT - Object Missing!", "red")
+            elif any_alert is not None:
+                self.update_status_bar("✅ All Secured - Monitoring", "green")
         
-        # Resize to fit display (maintain aspect ratio)
-        display_width = 900
-        display_height = 650
-        h, w = frame_rgb.shape[:2]
-        scale = min(display_width/w, display_height/h)
-        new_w, new_h = int(w*scale), int(h*scale)
+        self._drain_id = self.root.after(int(1000 / config.DISPLAY_FPS), self._drain_frames)
+    
+    def _on_root_visibility(self, event):
+        """<Map>/<Unmap> on the main window (child widgets' events are ignored)"""
+        if event.widget is self.root:
+            self._window_visible = event.type == tk.EventType.Map
+    
+    def _frame_to_ppm(self, frame):
+        """Resize a BGR frame to fit the display and encode it as binary PPM (video thread)"""
+        # Display size, buffers and PPM header depend only on the frame shape,
+        # which is fixed for a session, so they are recomputed only when it changes
+        if frame.shape != self._disp_shape:
+            # Resize to fit display (maintain aspect ratio)
+            display_width = 900
+            display_height = 650
+            h, w = frame.shape[:2]
+            scale = min(display_width/w, display_height/h)
+            new_w, new_h = int(w*scale), int(h*scale)
+            
+            self._disp_size = (new_w, new_h)
+            self._disp_buf = np.empty((new_h, new_w, 3), dtype=np.uint8)
+            self._rgb_buf = np.empty_like(self._disp_buf)
+            self._ppm_header = b'P6\n%d %d\n255\n' % (new_w, new_h)
+            self._disp_shape = frame.shape
         
-        frame_resized = cv2.resize(frame_rgb, (new_w, new_h))
+        cv2.resize(frame, self._disp_size, dst=self._disp_buf)
         
-        # Convert to PhotoImage
-        img = Image.fromarray(frame_resized)
-        imgtk = ImageTk.PhotoImage(image=img)
+        # Convert BGR to RGB (after resizing, so fewer pixels are converted)
+        frame_rgb = cv2.cvtColor(self._disp_buf, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
         
-        # Update label
-        self.camera_label.configure(image=imgtk)
-        self.camera_label.image = imgtk
+        # Tk reads binary PPM natively, so no PIL image is needed
+        return self._ppm_header + frame_rgb.tobytes()
+    
+    def update_camera_display(self, ppm, frame):
+        """Load a PPM-encoded frame into the camera label's photo (Tk thread)"""
+        self._camera_photo.configure(data=ppm, format='PPM')
         self.current_display_frame = frame
     
     def capture_frame(self):
@@ -503,8 +677,9 @@ class SurveillanceGUI:
         was_running = self.video_running
         if was_running:
             self.video_running = False
-            time.sleep(0.1)
+            self._paused.wait(timeout=1.5)  # Until the in-flight frame is done (process_frame waits up to 1 s)
 
+        # Snapshot the current frame for ROI setup (the capture thread keeps replacing current_frame)
         frame = self.engine.current_frame.copy()
         
         # Select ROI based on mode
@@ -529,9 +704,6 @@ class SurveillanceGUI:
                 
                 # ALWAYS resume video after ROI selection
                 self.video_running = True
-                # Start new video thread (old one stopped)
-                self.video_thread = threading.Thread(target=self.video_loop, daemon=True)
-                self.video_thread.start()
                 
                 self.update_status_bar("🟢 Monitoring Active", "green")
                 messagebox.showinfo("Success", "Monitoring started successfully!")
@@ -540,16 +712,12 @@ class SurveillanceGUI:
                 # Resume video if it was running before
                 if was_running:
                     self.video_running = True
-                    self.video_thread = threading.Thread(target=self.video_loop, daemon=True)
-                    self.video_thread.start()
         except Exception as e:
             self.add_log(f"Error during ROI selection: {e}")
             messagebox.showerror("Error", f"Failed to setup ROI: {e}")
             # Resume video if it was running before
             if was_running:
                 self.video_running = True
-                self.video_thread = threading.Thread(target=self.video_loop, daemon=True)
-                self.video_thread.start()
     
     def reselect_roi(self):
         """Re-select ROI on the same captured frame"""
@@ -592,10 +760,10 @@ class SurveillanceGUI:
         was_running = self.video_running
         if was_running:
             self.video_running = False
-            time.sleep(0.1)
+            self._paused.wait(timeout=1.5)  # Until the in-flight frame is done (process_frame waits up to 1 s)
         
-        # Use the stored reference frame
-        frame = self.engine.reference_frame.copy()
+        # Use the stored reference frame (capture_frame's private copy; ROI setup only reads it)
+        frame = self.engine.reference_frame
         
         # Select ROI based on mode
         success = False
@@ -618,8 +786,6 @@ class SurveillanceGUI:
                 
                 # Resume video
                 self.video_running = True
-                self.video_thread = threading.Thread(target=self.video_loop, daemon=True)
-                self.video_thread.start()
                 
                 self.update_status_bar("🟢 Monitoring Active", "green")
                 messagebox.showinfo("Success", "ROI re-selected and monitoring restarted!")
@@ -628,16 +794,12 @@ class SurveillanceGUI:
                 # Resume video if it was running
                 if was_running:
                     self.video_running = True
-                    self.video_thread = threading.Thread(target=self.video_loop, daemon=True)
-                    self.video_thread.start()
         except Exception as e:
             self.add_log(f"Error during ROI re-selection: {e}")
             messagebox.showerror("Error", f"Failed to re-select ROI: {e}")
             # Resume video if it was running
             if was_running:
                 self.video_running = True
-                self.video_thread = threading.Thread(target=self.video_loop, daemon=True)
-                self.video_thread.start()
     
     def stop_monitoring(self):
         """Stop monitoring"""
@@ -652,25 +814,45 @@ class SurveillanceGUI:
         self.add_log("Monitoring stopped")
     
     def update_threshold(self, value):
-        """Update alert threshold"""
+        """Update the threshold label; apply the value once the slider settles for 100 ms"""
         threshold = int(value)
-        self.engine.alert_threshold = threshold
-        config.ALERT_THRESHOLD = threshold
         self.threshold_label.configure(text=f"Alert Threshold: {threshold} frames")
         
-        # Update existing state managers
-        for roi_data in self.engine.roi_targets:
-            roi_data['state_manager'].alert_threshold = threshold
+        if self._threshold_job is not None:
+            self.root.after_cancel(self._threshold_job)
+        self._threshold_job = self.root.after(100, self._commit_threshold, threshold)
+    
+    def _commit_threshold(self, threshold):
+        """Apply the alert threshold (existing state managers share the engine's value)"""
+        self._threshold_job = None
+        self.engine.alert_threshold = threshold
+        config.ALERT_THRESHOLD = threshold
+    
+    def _queue_status_update(self, status_dict):
+        """Engine status callback (video thread): keep only the newest status for the Tk thread"""
+        self._pending_status = status_dict
     
     def update_status_display(self, status_dict):
         """Update status labels"""
         state_text = "Monitoring" if status_dict['is_monitoring'] else "Ready"
-        self.lbl_state.configure(text=f"State: {state_text}")
-        self.lbl_objects.configure(text=f"Objects Tracked: {status_dict['num_objects']}")
-        self.lbl_alerts.configure(text=f"Total Alerts: {status_dict['total_alerts']}")
+        texts = {
+            'state': f"State: {state_text}",
+            'objects': f"Objects Tracked: {status_dict['num_objects']}",
+            'alerts': f"Total Alerts: {status_dict['total_alerts']}",
+        }
+        labels = {'state': self.lbl_state, 'objects': self.lbl_objects, 'alerts': self.lbl_alerts}
+        
+        # Only reconfigure labels whose text changed (each configure re-lays out the label)
+        for key, text in texts.items():
+            if self._last_status.get(key) != text:
+                self._last_status[key] = text
+                labels[key].configure(text=text)
     
     def update_status_bar(self, text, color):
-        """Update bottom status bar"""
+        """Update bottom status bar (no-op if unchanged)"""
+        if self._last_status.get('status_bar') == (text, color):
+            return
+        self._last_status['status_bar'] = (text, color)
         self.status_bar.configure(text=text, text_color=color)
     
     def on_alert_callback(self, alert_record):
@@ -681,12 +863,23 @@ class SurveillanceGUI:
     def add_log(self, message):
         """Add message to log window"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        log_message = f"[{timestamp}] {message}\n"
         
-        self.log_text.configure(state="normal")
-        self.log_text.insert("end", log_message)
-        self.log_text.see("end")
-        self.log_text.configure(state="disabled")
+        # Only queued here (safe from any thread); _flush_logs writes them out
+        self._log_queue.append(f"[{timestamp}] {message}\n")
+    
+    def _flush_logs(self):
+        """Write all queued log lines with a single insert (Tk thread, every 200 ms)"""
+        if self._log_queue:
+            lines = []
+            while self._log_queue:
+                lines.append(self._log_queue.popleft())
+            
+            self.log_text.configure(state="normal")
+            self.log_text.insert("end", "".join(lines))
+            self.log_text.see("end")
+            self.log_text.configure(state="disabled")
+        
+        self._log_flush_id = self.root.after(200, self._flush_logs)
     
     # ===== DATA VIEW METHODS =====
     
@@ -775,7 +968,12 @@ class SurveillanceGUI:
     def on_closing(self):
         """Handle window close event"""
         self.video_running = False
-        time.sleep(0.2)
+        self._shutdown.set()
+        self._run_event.set()  # Wake the paused video thread so it exits
+        for after_id in (self._drain_id, self._log_flush_id, self._threshold_job):
+            if after_id is not None:
+                self.root.after_cancel(after_id)
+        self.video_thread.join(timeout=1.5)  # process_frame waits up to 1 s for a frame
         self.engine.cleanup()
         self.root.destroy()
     
@@ -796,12 +994,13 @@ class ImageGalleryWindow:
         
         self.images = images
         self.current_index = 0
+        self._tk_cache = OrderedDict()  # current_index -> PhotoImage
         
         # Title
         title_label = ctk.CTkLabel(
             self.window,
             text=f"📸 {title}",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_font(18, "bold")
         )
         title_label.pack(pady=10)
         
@@ -835,18 +1034,11 @@ class ImageGalleryWindow:
             text=f"Image {self.current_index + 1} of {len(self.images)} - {img_data['timestamp']}"
         )
         
-        # Load and display image
-        frame = img_data['frame']
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        # Resize
-        h, w = frame_rgb.shape[:2]
-        scale = min(700/w, 500/h)
-        new_w, new_h = int(w*scale), int(h*scale)
-        frame_resized = cv2.resize(frame_rgb, (new_w, new_h))
-        
-        img = Image.fromarray(frame_resized)
-        imgtk = ImageTk.PhotoImage(image=img)
+        # Load and display image (converted once per index, then reused)
+        imgtk = _cache_get(self._tk_cache, self.current_index)
+        if imgtk is None:
+            imgtk = _frame_to_photo(img_data['frame'], 700, 500)
+            _cache_put(self._tk_cache, self.current_index, imgtk)
         
         self.image_label.configure(image=imgtk)
         self.image_label.image = imgtk
@@ -874,7 +1066,7 @@ class AlertLogWindow:
         title_label = ctk.CTkLabel(
             self.window,
             text="🚨 Alert Logs",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_font(18, "bold")
         )
         title_label.pack(pady=10)
         
@@ -891,7 +1083,7 @@ class AlertLogWindow:
             time_label = ctk.CTkLabel(
                 alert_frame,
                 text=f"⏰ {alert['timestamp']}",
-                font=ctk.CTkFont(weight="bold")
+                font=_font(weight="bold")
             )
             time_label.pack(anchor="w", padx=10, pady=(5, 2))
             
@@ -908,7 +1100,7 @@ class AlertLogWindow:
             file_label = ctk.CTkLabel(
                 alert_frame,
                 text=f"📁 {alert['filename']}",
-                font=ctk.CTkFont(size=10),
+                font=_font(10),
                 text_color="gray"
             )
             file_label.pack(anchor="w", padx=10, pady=(2, 5))
@@ -925,9 +1117,15 @@ class AlertLogWindow:
     def view_alert_image(self, filename):
         """Open alert image in new window"""
         if os.path.exists(filename):
-            frame = cv2.imread(filename)
-            if frame is not None:
-                ImageViewWindow(self.window, frame, filename)
+            # Snapshots are never rewritten, so a reopened file reuses its PhotoImage
+            imgtk = _cache_get(_ALERT_PHOTO_CACHE, filename)
+            if imgtk is None:
+                frame = cv2.imread(filename)
+                if frame is None:
+                    return
+                imgtk = _frame_to_photo(frame, 750, 550)
+                _cache_put(_ALERT_PHOTO_CACHE, filename, imgtk)
+            ImageViewWindow(self.window, imgtk, filename)
         else:
             messagebox.showerror("Error", "Image file not found!")
 
@@ -935,22 +1133,12 @@ class AlertLogWindow:
 class ImageViewWindow:
     """Simple window to view a single image"""
     
-    def __init__(self, parent, frame, title="Image"):
+    def __init__(self, parent, imgtk, title="Image"):
         self.window = ctk.CTkToplevel(parent)
         self.window.title(title)
         self.window.geometry("800x600")
         
-        # Convert and display
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        h, w = frame_rgb.shape[:2]
-        scale = min(750/w, 550/h)
-        new_w, new_h = int(w*scale), int(h*scale)
-        frame_resized = cv2.resize(frame_rgb, (new_w, new_h))
-        
-        img = Image.fromarray(frame_resized)
-        imgtk = ImageTk.PhotoImage(image=img)
-        
+        # Display the already converted image
         label = ctk.CTkLabel(self.window, image=imgtk, text="")
         label.image = imgtk
         label.pack(expand=True, padx=10, pady=10)
@@ -968,7 +1156,7 @@ class MissingObjectsWindow:
         title_label = ctk.CTkLabel(
             self.window,
             text="⚠️ Currently Missing",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=_font(18, "bold"),
             text_color="red"
         )
         title_label.pack(pady=10)
@@ -985,7 +1173,7 @@ class MissingObjectsWindow:
             label = ctk.CTkLabel(
                 obj_frame,
                 text=f"🚫 {obj['name']} (ID: {obj['id']})",
-                font=ctk.CTkFont(size=14),
+                font=_font(14),
                 text_color="orange"
             )
             label.pack(padx=10, pady=10)
@@ -2,18 +2,149 @@
 Email Alerter - Send email notifications for missing object alerts
 """
 
+import atexit
 import smtplib
 import os
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.image import MIMEImage
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from email.message import EmailMessage, MIMEPart
 from datetime import datetime, timedelta
-from typing import Optional, List
-from dotenv import load_dotenv
+from typing import Optional, List, Dict
 import config
 
-# Load environment variables
-load_dotenv()
+# Cooldown timestamps kept for at most this many object IDs (least recently used dropped first)
+_MAX_COOLDOWN_ENTRIES = 4096
+
+# Snapshot attachments kept base64-encoded for reuse (one snapshot is mailed once per missing object)
+_MAX_CACHED_ATTACHMENTS = 16
+
+# The "cooldown active" message is printed at most this often per object (seconds)
+_COOLDOWN_LOG_INTERVAL = 5.0
+
+# Alert email HTML, built once; %-placeholders so the CSS braces need no escaping
+_EMAIL_TEMPLATE = """
+<html>
+  <head>
+    <style>
+      body {
+        font-family: Arial, sans-serif;
+        line-height: 1.6;
+        color: #333;
+      }
+      .header {
+        background-color: #dc3545;
+        color: white;
+        padding: 20px;
+        text-align: center;
+        border-radius: 5px;
+      }
+      .content {
+        padding: 20px;
+        background-color: #f8f9fa;
+        margin: 20px 0;
+        border-radius: 5px;
+      }
+      .alert-box {
+        background-color: #fff3cd;
+        border-left: 4px solid #ffc107;
+        padding: 15px;
+        margin: 15px 0;
+      }
+      .details {
+        margin: 15px 0;
+      }
+      .details-table {
+        width: 100%%;
+        border-collapse: collapse;
+      }
+      .details-table td {
+        padding: 8px;
+        border-bottom: 1px solid #ddd;
+      }
+      .details-table td:first-child {
+        font-weight: bold;
+        width: 150px;
+      }
+      .footer {
+        text-align: center;
+        color: #666;
+        font-size: 12px;
+        margin-top: 20px;
+      }
+    </style>
+  </head>
+  <body>
+    <div class="header">
+      <h1>🚨 Missing Object Alert</h1>
+    </div>
+    
+    <div class="content">
+      <div class="alert-box">
+        <h2>⚠️ %(headline)s</h2>
+        <p>%(summary)s</p>
+      </div>
+      
+      <div class="details">
+        <h3>Alert Details:</h3>
+%(details)s      </div>
+      
+      <div class="alert-box">
+        <p><strong>📸 Snapshot:</strong> A snapshot from the time the object went missing is attached to this email.</p>
+      </div>
+    </div>
+    
+    <div class="footer">
+      <p>This is an automated alert from Missing Object Surveillance System</p>
+      <p>Generated at %(generated_at)s</p>
+    </div>
+  </body>
+</html>
+"""
+
+# One object's table in the alert email's details section
+_DETAILS_TEMPLATE = """\
+        <table class="details-table">
+          <tr>
+            <td>Object:</td>
+            <td><strong>%(object_name)s</strong></td>
+          </tr>
+          <tr>
+            <td>Tracking ID:</td>
+            <td>%(object_id)s</td>
+          </tr>
+          <tr>
+            <td>Location:</td>
+            <td>Region of Interest%(roi_info)s</td>
+          </tr>
+          <tr>
+            <td>Alert Time:</td>
+            <td>%(timestamp)s</td>
+          </tr>
+          <tr>
+            <td>Status:</td>
+            <td><span style="color: #dc3545; font-weight: bold;">MISSING</span></td>
+          </tr>
+        </table>
+"""
+
+# Body of the test_connection email
+_TEST_EMAIL_TEMPLATE = """
+<html>
+  <body>
+    <h2>✅ Email Configuration Test Successful!</h2>
+    <p>Your Missing Object Surveillance System is now configured to send email alerts.</p>
+    <p><strong>Configuration:</strong></p>
+    <ul>
+      <li>Sender: %(sender)s</li>
+      <li>Recipients: %(recipients)s</li>
+      <li>Cooldown: %(cooldown)s seconds</li>
+    </ul>
+    <p>You will receive alerts when tracked objects go missing.</p>
+  </body>
+</html>
+"""
 
 
 class EmailAlerter:
@@ -21,6 +152,11 @@ class EmailAlerter:
     
     def __init__(self):
         """Initialize email alerter with credentials from .env file"""
+        # Read .env here rather than at import: the engine imports this module at startup,
+        # but the alerter is only built on the first alert or email test
+        from dotenv import load_dotenv
+        load_dotenv()
+        
         self.enabled = config.EMAIL_ALERTS_ENABLED
         self.cooldown_seconds = config.EMAIL_ALERT_COOLDOWN
         self.include_image = config.EMAIL_INCLUDE_IMAGE
@@ -33,10 +169,25 @@ class EmailAlerter:
         self.smtp_port = int(os.getenv('SMTP_PORT', '587'))
         
         # Clean recipient emails
-        self.recipients = [email.strip() for email in self.recipients if email.strip()]
+        self.recipients = tuple(email.strip() for email in self.recipients if email.strip())
+        self._recipients_header = ', '.join(self.recipients)  # For To: headers and logs
+        
+        # Track last email sent time for cooldown, as time.monotonic() seconds (LRU-bounded: tracker IDs keep growing)
+        self.last_email_time = OrderedDict()
+        self._last_cooldown_log = {}  # object_id -> monotonic time of the last cooldown message
+        
+        # Encoded attachment parts keyed by (path, mtime_ns, size), LRU-bounded
+        self._attachment_cache = OrderedDict()
+        
+        # Snapshots are read/re-encoded here while the sending thread builds the body
+        # and checks the SMTP session (one worker, so the cache needs no lock)
+        self._encode_pool = ThreadPoolExecutor(max_workers=1)
         
-        # Track last email sent time for cooldown
-        self.last_email_time = {}
+        # SMTP session kept open between emails, so STARTTLS + login happen once
+        # rather than per alert (lock: alerts and test emails come from different threads)
+        self._smtp = None
+        self._smtp_lock = threading.Lock()
+        atexit.register(self.close)
         
         # Validate configuration
         self._validate_config()
@@ -69,124 +220,71 @@ class EmailAlerter:
         
         print(f"✅ Email alerts configured successfully")
         print(f"   Sender: {self.sender_email}")
-        print(f"   Recipients: {', '.join(self.recipients)}")
+        print(f"   Recipients: {self._recipients_header}")
         print(f"   Cooldown: {self.cooldown_seconds} seconds")
         return True
     
-    def _check_cooldown(self, object_id: int) -> bool:
-        """Check if cooldown period has passed for this object"""
-        if object_id not in self.last_email_time:
-            return True
+    def _check_cooldown(self, object_id: int, now: float) -> float:
+        """Seconds of cooldown left for this object at monotonic time now (0 when it may alert)"""
+        last = self.last_email_time.get(object_id)
+        if last is None:
+            return 0.0
         
-        elapsed = (datetime.now() - self.last_email_time[object_id]).total_seconds()
-        return elapsed >= self.cooldown_seconds
+        self.last_email_time.move_to_end(object_id)
+        return max(0.0, self.cooldown_seconds - (now - last))
     
-    def _create_email_body(self, object_name: str, object_id: int, 
-                          timestamp: str, roi_index: int = None) -> str:
-        """Create HTML email body"""
-        roi_info = f" (ROI #{roi_index})" if roi_index is not None else ""
+    def _create_email_body(self, objects: List[Dict], timestamp: str) -> str:
+        """Create HTML email body (one details table per object)"""
+        details = ''.join(_DETAILS_TEMPLATE % {
+            'object_name': obj['name'],
+            'object_id': obj['id'],
+            'roi_info': f" (ROI #{obj['roi_index']})" if obj.get('roi_index') is not None else "",
+            'timestamp': timestamp,
+        } for obj in objects)
         
-        html = f"""
-        <html>
-          <head>
-            <style>
-              body {{
-                font-family: Arial, sans-serif;
-                line-height: 1.6;
-                color: #333;
-              }}
-              .header {{
-                background-color: #dc3545;
-                color: white;
-                padding: 20px;
-                text-align: center;
-                border-radius: 5px;
-              }}
-              .content {{
-                padding: 20px;
-                background-color: #f8f9fa;
-                margin: 20px 0;
-                border-radius: 5px;
-              }}
-              .alert-box {{
-                background-color: #fff3cd;
-                border-left: 4px solid #ffc107;
-                padding: 15px;
-                margin: 15px 0;
-              }}
-              .details {{
-                margin: 15px 0;
-              }}
-              .details-table {{
-                width: 100%;
-                border-collapse: collapse;
-              }}
-              .details-table td {{
-                padding: 8px;
-                border-bottom: 1px solid #ddd;
-              }}
-              .details-table td:first-child {{
-                font-weight: bold;
-                width: 150px;
-              }}
-              .footer {{
-                text-align: center;
-                color: #666;
-                font-size: 12px;
-                margin-top: 20px;
-              }}
-            </style>
-          </head>
-          <body>
-            <div class="header">
-              <h1>🚨 Missing Object Alert</h1>
-            </div>
-            
-            <div class="content">
-              <div class="alert-box">
-                <h2>⚠️ Object Has Gone Missing!</h2>
-                <p>The surveillance system has detected that a tracked object is no longer in its designated area.</p>
-              </div>
-              
-              <div class="details">
-                <h3>Alert Details:</h3>
-                <table class="details-table">
-                  <tr>
-                    <td>Object:</td>
-                    <td><strong>{object_name}</strong></td>
-                  </tr>
-                  <tr>
-                    <td>Tracking ID:</td>
-                    <td>{object_id}</td>
-                  </tr>
-                  <tr>
-                    <td>Location:</td>
-                    <td>Region of Interest{roi_info}</td>
-                  </tr>
-                  <tr>
-                    <td>Alert Time:</td>
-                    <td>{timestamp}</td>
-                  </tr>
-                  <tr>
-                    <td>Status:</td>
-                    <td><span style="color: #dc3545; font-weight: bold;">MISSING</span></td>
-                  </tr>
-                </table>
-              </div>
-              
-              <div class="alert-box">
-                <p><strong>📸 Snapshot:</strong> A snapshot from the time the object went missing is attached to this email.</p>
-              </div>
-            </div>
-            
-            <div class="footer">
-              <p>This is an automated alert from Missing Object Surveillance System</p>
-              <p>Generated at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            </div>
-          </body>
-        </html>
-        """
-        return html
+        if len(objects) == 1:
+            headline = "Object Has Gone Missing!"
+            summary = "The surveillance system has detected that a tracked object is no longer in its designated area."
+        else:
+            headline = f"{len(objects)} Objects Have Gone Missing!"
+            summary = "The surveillance system has detected that several tracked objects are no longer in their designated areas."
+        
+        return _EMAIL_TEMPLATE % {
+            'headline': headline,
+            'summary': summary,
+            'details': details,
+            'generated_at': timestamp,  # Same clock read as the subject line
+        }
+    
+    def _read_attachment(self, image_path: str) -> bytes:
+        """Snapshot JPEG bytes to attach, re-encoded smaller if over EMAIL_MAX_IMAGE_BYTES"""
+        if os.path.getsize(image_path) <= config.EMAIL_MAX_IMAGE_BYTES:
+            with open(image_path, 'rb') as img_file:
+                return img_file.read()
+        
+        import cv2  # Only needed for oversized snapshots
+        success, encoded = cv2.imencode('.jpg', cv2.imread(image_path),
+                                        [cv2.IMWRITE_JPEG_QUALITY, config.EMAIL_IMAGE_REENCODE_QUALITY])
+        if not success:
+            raise ValueError(f"could not re-encode {image_path}")
+        return encoded.tobytes()
+    
+    def _attachment_part(self, image_path: str) -> MIMEPart:
+        """Encoded attachment part for a snapshot, reused while the file is unchanged"""
+        stat = os.stat(image_path)
+        key = (image_path, stat.st_mtime_ns, stat.st_size)
+        part = self._attachment_cache.get(key)
+        if part is not None:
+            self._attachment_cache.move_to_end(key)
+            return part
+        
+        part = MIMEPart()
+        part.set_content(self._read_attachment(image_path), maintype='image', subtype='jpeg',
+                         disposition='attachment', filename=os.path.basename(image_path))
+        self._attachment_cache[key] = part
+        if len(self._attachment_cache) > _MAX_CACHED_ATTACHMENTS:
+            self._attachment_cache.popitem(last=False)
+        return part
     
     def send_alert(self, object_name: str, object_id: int, 
                    image_path: Optional[str] = None, 
@@ -203,68 +301,159 @@ class EmailAlerter:
         Returns:
             bool: True if email sent successfully, False otherwise
         """
+        obj = {'name': object_name, 'id': object_id, 'roi_index': roi_index}
+        return self.send_alerts([obj], image_path)[0]
+    
+    def send_alerts(self, objects: List[Dict], image_path: Optional[str] = None) -> List[bool]:
+        """
+        Send one email covering several objects that went missing together
+        
+        Args:
+            objects: Dicts with 'name', 'id' and optional 'roi_index' (engine alert objects)
+            image_path: Path to the shared alert snapshot (optional)
+            
+        Returns:
+            List[bool]: Per object, True if it was included in a successfully sent email
+        """
+        results = [False] * len(objects)
         if not self.enabled:
-            return False
+            return results
         
-        # Check cooldown
-        if not self._check_cooldown(object_id):
-            remaining = self.cooldown_seconds - (datetime.now() - self.last_email_time[object_id]).total_seconds()
-            print(f"⏳ Email cooldown active. Next email in {int(remaining)} seconds")
-            return False
+        # Check cooldown per object (logging the rejection at most every _COOLDOWN_LOG_INTERVAL per object)
+        now = time.monotonic()
+        due = []
+        for i, obj in enumerate(objects):
+            object_id = obj['id']
+            remaining = self._check_cooldown(object_id, now)
+            if remaining:
+                if now - self._last_cooldown_log.get(object_id, -_COOLDOWN_LOG_INTERVAL) >= _COOLDOWN_LOG_INTERVAL:
+                    self._last_cooldown_log[object_id] = now
+                    print(f"⏳ Email cooldown active. Next email in {int(remaining)} seconds")
+            else:
+                due.append(i)
+        if not due:
+            return results
+        due_objects = [objects[i] for i in due]
         
         try:
+            # Start preparing the attachment first; it is only needed right before DATA
+            attachment = None
+            if self.include_image and image_path and os.path.exists(image_path):
+                attachment = self._encode_pool.submit(self._attachment_part, image_path)
+            
             # Create message
-            msg = MIMEMultipart('related')
+            msg = EmailMessage()
             msg['From'] = self.sender_email
-            msg['To'] = ', '.join(self.recipients)
+            msg['To'] = self._recipients_header
             
             timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            roi_text = f" (ROI #{roi_index})" if roi_index is not None else ""
-            msg['Subject'] = f"🚨 ALERT: {object_name.upper()} Missing{roi_text} - {timestamp}"
+            if len(due_objects) == 1:
+                obj = due_objects[0]
+                roi_text = f" (ROI #{obj['roi_index']})" if obj.get('roi_index') is not None else ""
+                msg['Subject'] = f"🚨 ALERT: {obj['name'].upper()} Missing{roi_text} - {timestamp}"
+            else:
+                names = ', '.join(obj['name'].upper() for obj in due_objects)
+                msg['Subject'] = f"🚨 ALERT: {len(due_objects)} Objects Missing ({names}) - {timestamp}"
             
             # Create HTML body
-            html_body = self._create_email_body(object_name, object_id, timestamp, roi_index)
-            msg.attach(MIMEText(html_body, 'html'))
+            html_body = self._create_email_body(due_objects, timestamp)
+            msg.set_content(html_body, subtype='html')
             
-            # Attach image if provided and enabled
-            if self.include_image and image_path and os.path.exists(image_path):
-                try:
-                    with open(image_path, 'rb') as img_file:
-                        img_data = img_file.read()
-                        image = MIMEImage(img_data, name=os.path.basename(image_path))
-                        image.add_header('Content-Disposition', 'attachment', 
-                                       filename=os.path.basename(image_path))
-                        msg.attach(image)
-                    print(f"📎 Image attached: {os.path.basename(image_path)}")
-                except Exception as e:
-                    print(f"⚠️ Failed to attach image: {e}")
-            
-            # Send email
+            # Send email (the image is attached once the SMTP session is ready)
             print(f"📧 Sending email alert to {len(self.recipients)} recipient(s)...")
-            
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()  # Secure connection
-                server.login(self.sender_email, self.sender_password)
-                server.send_message(msg)
+            self._send(msg, attachment)
             
             # Update last email time
-            self.last_email_time[object_id] = datetime.now()
+            sent_at = time.monotonic()
+            for obj in due_objects:
+                self.last_email_time[obj['id']] = sent_at
+                self.last_email_time.move_to_end(obj['id'])
+            while len(self.last_email_time) > _MAX_COOLDOWN_ENTRIES:
+                dropped_id, _ = self.last_email_time.popitem(last=False)
+                self._last_cooldown_log.pop(dropped_id, None)
             
             print(f"✅ Email alert sent successfully!")
-            print(f"   Object: {object_name} (ID: {object_id})")
-            print(f"   Recipients: {', '.join(self.recipients)}")
-            return True
+            for obj in due_objects:
+                print(f"   Object: {obj['name']} (ID: {obj['id']})")
+            print(f"   Recipients: {self._recipients_header}")
+            for i in due:
+                results[i] = True
+            return results
             
         except smtplib.SMTPAuthenticationError:
             print("❌ Email authentication failed!")
             print("   Check your EMAIL_PASSWORD in .env file")
             print("   Make sure you're using an App Password (not your regular Gmail password)")
             self.enabled = False  # Disable further attempts
-            return False
+            return results
             
         except Exception as e:
             print(f"❌ Failed to send email: {e}")
-            return False
+            return results
+    
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Return the open SMTP session, reconnecting if the server has dropped it (hold _smtp_lock)"""
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._drop_smtp()
+        
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            server.ehlo()
+            server.starttls()  # Secure connection
+            server.ehlo()
+            server.login(self.sender_email, self.sender_password)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        return server
+    
+    def _drop_smtp(self):
+        """Close the SMTP session, ignoring errors from an already dead connection (hold _smtp_lock)"""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+    
+    def _attach_image(self, msg, attachment):
+        """Attach a prepared snapshot part (a Future from _encode_pool) to msg"""
+        try:
+            part = attachment.result()
+            msg.make_mixed()
+            msg.attach(part)
+            print(f"📎 Image attached: {part.get_filename()}")
+        except Exception as e:
+            print(f"⚠️ Failed to attach image: {e}")
+    
+    def _send(self, msg, attachment=None):
+        """Send a message over the shared SMTP session, attaching a pending snapshot part just before DATA"""
+        with self._smtp_lock:
+            try:
+                server = self._get_smtp()  # Connect / health check while the attachment is prepared
+                if attachment is not None:
+                    self._attach_image(msg, attachment)
+                    attachment = None
+                server.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # Dropped between the health check and the send: reconnect once
+                self._drop_smtp()
+                server = self._get_smtp()
+                if attachment is not None:
+                    self._attach_image(msg, attachment)
+                server.send_message(msg)
+    
+    def close(self):
+        """Close the shared SMTP session (also run at exit)"""
+        with self._smtp_lock:
+            self._drop_smtp()
     
     def test_connection(self) -> bool:
         """Test email configuration by sending a test email"""
@@ -276,36 +465,23 @@ class EmailAlerter:
             print("🧪 Testing email configuration...")
             
             # Create test message
-            msg = MIMEMultipart()
+            msg = EmailMessage()
             msg['From'] = self.sender_email
-            msg['To'] = ', '.join(self.recipients)
+            msg['To'] = self._recipients_header
             msg['Subject'] = "✅ Test Email - Surveillance System"
             
-            body = """
-            <html>
-              <body>
-                <h2>✅ Email Configuration Test Successful!</h2>
-                <p>Your Missing Object Surveillance System is now configured to send email alerts.</p>
-                <p><strong>Configuration:</strong></p>
-                <ul>
-                  <li>Sender: """ + self.sender_email + """</li>
-                  <li>Recipients: """ + ', '.join(self.recipients) + """</li>
-                  <li>Cooldown: """ + str(self.cooldown_seconds) + """ seconds</li>
-                </ul>
-                <p>You will receive alerts when tracked objects go missing.</p>
-              </body>
-            </html>
-            """
-            msg.attach(MIMEText(body, 'html'))
+            body = _TEST_EMAIL_TEMPLATE % {
+                'sender': self.sender_email,
+                'recipients': self._recipients_header,
+                'cooldown': self.cooldown_seconds,
+            }
+            msg.set_content(body, subtype='html')
             
             # Send test email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.sender_email, self.sender_password)
-                server.send_message(msg)
+            self._send(msg)
             
             print("✅ Test email sent successfully!")
-            print(f"   Check inbox: {', '.join(self.recipients)}")
+            print(f"   Check inbox: {self._recipients_header}")
             return True
             
         except Exception as e:
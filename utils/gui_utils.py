@@ -5,6 +5,17 @@ Provides professional overlays and visual feedback for each step
 
 import cv2
 import numpy as np
+from functools import lru_cache
+
+# Heavier face for titles, keys and status text (OpenCV has no FONT_HERSHEY_BOLD)
+_BOLD_FONT = cv2.FONT_HERSHEY_DUPLEX
+
+
+@lru_cache(maxsize=256)
+def _text_size(text, font, font_scale, thickness):
+    """cv2.getTextSize, memoized: the overlay strings repeat every frame"""
+    return cv2.getTextSize(text, font, font_scale, thickness)
+
 
 class SurveillanceGUI:
     """Professional GUI overlay system for surveillance application"""
@@ -22,17 +33,33 @@ class SurveillanceGUI:
         'black': (0, 0, 0)               # Black
     }
     
+    # Rasterized text keyed by (text, font, scale, color, thickness), for draw_cached_text
+    _text_sprites = {}
+    
+    # Pre-rendered static screen overlays keyed by (screen, frame shape, args), for _composite_chrome
+    _chrome_cache = {}
+    
+    # Solid 'dark' frames keyed by frame shape, for the loading screen dim
+    _dim_backdrops = {}
+    
     @staticmethod
     def draw_rounded_rectangle(img, pt1, pt2, color, thickness=2, radius=15):
-        """Draw a rounded rectangle"""
+        """Draw a rounded rectangle (thickness=-1 fills it)"""
         x1, y1 = pt1
         x2, y2 = pt2
+        axes = (radius, radius)
         
-        # Draw the four corners as circles
-        cv2.circle(img, (x1 + radius, y1 + radius), radius, color, thickness)
-        cv2.circle(img, (x2 - radius, y1 + radius), radius, color, thickness)
-        cv2.circle(img, (x1 + radius, y2 - radius), radius, color, thickness)
-        cv2.circle(img, (x2 - radius, y2 - radius), radius, color, thickness)
+        # Draw the four corners as quarter arcs
+        cv2.ellipse(img, (x1 + radius, y1 + radius), axes, 180, 0, 90, color, thickness)
+        cv2.ellipse(img, (x2 - radius, y1 + radius), axes, 270, 0, 90, color, thickness)
+        cv2.ellipse(img, (x2 - radius, y2 - radius), axes, 0, 0, 90, color, thickness)
+        cv2.ellipse(img, (x1 + radius, y2 - radius), axes, 90, 0, 90, color, thickness)
+        
+        if thickness < 0:
+            # Fill the body as a cross of two rectangles between the arcs
+            cv2.rectangle(img, (x1 + radius, y1), (x2 - radius, y2), color, -1)
+            cv2.rectangle(img, (x1, y1 + radius), (x2, y2 - radius), color, -1)
+            return
         
         # Draw the four edges
         cv2.line(img, (x1 + radius, y1), (x2 - radius, y1), color, thickness)
@@ -43,17 +70,26 @@ class SurveillanceGUI:
     @staticmethod
     def draw_panel(img, x, y, width, height, color, alpha=0.85, border_color=None, border_thickness=2):
         """Draw a semi-transparent panel"""
-        overlay = img.copy()
-        
-        # Draw filled rectangle
-        cv2.rectangle(overlay, (x, y), (x + width, y + height), color, -1)
+        # Only the panel area (plus the border's outer half) is copied and blended,
+        # not the whole frame
+        pad = border_thickness if border_color else 0
+        img_h, img_w = img.shape[:2]
+        x1, y1 = max(x - pad, 0), max(y - pad, 0)
+        x2, y2 = min(x + width + pad + 1, img_w), min(y + height + pad + 1, img_h)
+        if x1 >= x2 or y1 >= y2:
+            return
+        roi = img[y1:y2, x1:x2]
+        overlay = roi.copy()
+        
+        # Draw filled rectangle (in ROI coordinates)
+        cv2.rectangle(overlay, (x - x1, y - y1), (x + width - x1, y + height - y1), color, -1)
         
         # Add border if specified
         if border_color:
-            cv2.rectangle(overlay, (x, y), (x + width, y + height), border_color, border_thickness)
+            cv2.rectangle(overlay, (x - x1, y - y1), (x + width - x1, y + height - y1), border_color, border_thickness)
         
         # Blend with original
-        cv2.addWeighted(overlay, alpha, img, 1 - alpha, 0, img)
+        cv2.addWeighted(overlay, alpha, roi, 1 - alpha, 0, roi)
     
     @staticmethod
     def draw_text_with_background(img, text, position, font=cv2.FONT_HERSHEY_SIMPLEX, 
@@ -63,7 +99,7 @@ class SurveillanceGUI:
         x, y = position
         
         # Get text size
-        (text_width, text_height), baseline = cv2.getTextSize(text, font, font_scale, thickness)
+        (text_width, text_height), baseline = _text_size(text, font, font_scale, thickness)
         
         # Draw background rectangle
         cv2.rectangle(img, 
@@ -76,6 +112,63 @@ class SurveillanceGUI:
         
         return text_height + baseline + 2 * padding
     
+    @staticmethod
+    def draw_cached_text(img, text, org, font, font_scale, color, thickness):
+        """
+        cv2.putText for strings redrawn every frame: the text is rasterized once
+        into a color patch + mask, then each call is a single masked copy
+        """
+        key = (text, font, font_scale, color, thickness)
+        sprite = SurveillanceGUI._text_sprites.get(key)
+        if sprite is None:
+            (text_width, text_height), baseline = cv2.getTextSize(text, font, font_scale, thickness)
+            mask = np.zeros((text_height + baseline + 2 * thickness, text_width + 2 * thickness), dtype=np.uint8)
+            cv2.putText(mask, text, (thickness, text_height + thickness), font, font_scale, 255, thickness, cv2.LINE_AA)
+            mask = cv2.threshold(mask, 127, 255, cv2.THRESH_BINARY)[1]
+            patch = np.empty(mask.shape + (3,), dtype=np.uint8)
+            patch[:] = color
+            sprite = SurveillanceGUI._text_sprites[key] = (patch, mask, text_height + thickness, thickness)
+        
+        patch, mask, top, left = sprite
+        x, y = org[0] - left, org[1] - top
+        
+        # Clip the sprite to the image
+        x1, y1 = max(x, 0), max(y, 0)
+        x2, y2 = min(x + mask.shape[1], img.shape[1]), min(y + mask.shape[0], img.shape[0])
+        if x1 < x2 and y1 < y2:
+            cv2.copyTo(patch[y1 - y:y2 - y, x1 - x:x2 - x], mask[y1 - y:y2 - y, x1 - x:x2 - x], img[y1:y2, x1:x2])
+    
+    @staticmethod
+    def _composite_chrome(frame, key, draw_chrome):
+        """
+        Composite a screen's static overlay onto frame. draw_chrome(img) is run once
+        per key, on a black and on a white canvas: the black render is the overlay
+        itself and white minus black is how much background shows through each
+        pixel (255 untouched, 0 opaque). Every later frame is then one
+        multiply-add over the rows the overlay covers, instead of redrawing it.
+        """
+        chrome = SurveillanceGUI._chrome_cache.get(key)
+        if chrome is None:
+            layer = np.zeros(frame.shape, dtype=np.uint8)
+            white = np.full(frame.shape, 255, dtype=np.uint8)
+            draw_chrome(layer)
+            draw_chrome(white)
+            weight = cv2.subtract(white, layer)
+            
+            # Contiguous row bands that contain overlay pixels
+            rows = np.flatnonzero((weight < 255).any(axis=(1, 2)))
+            breaks = np.flatnonzero(np.diff(rows) > 1)
+            starts = np.concatenate(([rows[0]], rows[breaks + 1])) if rows.size else []
+            ends = np.concatenate((rows[breaks], [rows[-1]])) + 1 if rows.size else []
+            chrome = (layer, weight, list(zip(starts, ends)))
+            SurveillanceGUI._chrome_cache[key] = chrome
+        
+        layer, weight, bands = chrome
+        for y1, y2 in bands:
+            band = frame[y1:y2]
+            cv2.multiply(band, weight[y1:y2], dst=band, scale=1 / 255)
+            cv2.add(band, layer[y1:y2], dst=band)
+    
     @staticmethod
     def draw_header(img, title, subtitle=None):
         """Draw a professional header at the top of the frame"""
@@ -87,7 +180,7 @@ class SurveillanceGUI:
         # Draw title
         title_y = 50
         cv2.putText(img, title, (30, title_y), 
-                   cv2.FONT_HERSHEY_BOLD, 1.2, SurveillanceGUI.COLORS['primary'], 3, cv2.LINE_AA)
+                   _BOLD_FONT, 1.2, SurveillanceGUI.COLORS['primary'], 3, cv2.LINE_AA)
         
         # Draw subtitle if provided
         if subtitle:
@@ -125,17 +218,17 @@ class SurveillanceGUI:
             
             # Key text
             key_text = key.upper()
-            (kw, kh), _ = cv2.getTextSize(key_text, cv2.FONT_HERSHEY_BOLD, 0.6, 2)
+            (kw, kh), _ = _text_size(key_text, _BOLD_FONT, 0.6, 2)
             cv2.putText(img, key_text, 
                        (x_offset + (key_width - kw) // 2, y_pos - 5),
-                       cv2.FONT_HERSHEY_BOLD, 0.6, SurveillanceGUI.COLORS['white'], 2, cv2.LINE_AA)
+                       _BOLD_FONT, 0.6, SurveillanceGUI.COLORS['white'], 2, cv2.LINE_AA)
             
             # Description text
             cv2.putText(img, description, (x_offset + key_width + 15, y_pos - 5),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, SurveillanceGUI.COLORS['light'], 1, cv2.LINE_AA)
             
             # Calculate next position
-            desc_width = cv2.getTextSize(description, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 1)[0][0]
+            desc_width = _text_size(description, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 1)[0][0]
             x_offset += key_width + desc_width + 50
             
             # Wrap to next line if needed
@@ -182,10 +275,16 @@ class SurveillanceGUI:
             text_y += line_height
     
     @staticmethod
-    def draw_live_preview_gui(frame):
-        """Draw GUI for live preview mode"""
-        display_frame = frame.copy()
-        
+    def draw_live_preview_gui(frame, inplace=False):
+        """Draw GUI for live preview mode (inplace=True draws on frame itself, skipping the copy)"""
+        display_frame = frame if inplace else frame.copy()
+        SurveillanceGUI._composite_chrome(display_frame, ('live_preview', display_frame.shape),
+                                          SurveillanceGUI._draw_live_preview_chrome)
+        return display_frame
+    
+    @staticmethod
+    def _draw_live_preview_chrome(display_frame):
+        """Header, crosshair, instructions and footer of the live preview"""
         # Draw header
         SurveillanceGUI.draw_header(display_frame, 
                                     "LIVE PREVIEW MODE",
@@ -218,13 +317,18 @@ class SurveillanceGUI:
             ('q', 'Quit', 'danger')
         ]
         SurveillanceGUI.draw_footer_controls(display_frame, controls)
-        
+    
+    @staticmethod
+    def draw_mode_selection_gui(frame, inplace=False):
+        """Draw GUI for mode selection (inplace=True draws on frame itself, skipping the copy)"""
+        display_frame = frame if inplace else frame.copy()
+        SurveillanceGUI._composite_chrome(display_frame, ('mode_selection', display_frame.shape),
+                                          SurveillanceGUI._draw_mode_selection_chrome)
         return display_frame
     
     @staticmethod
-    def draw_mode_selection_gui(frame):
-        """Draw GUI for mode selection"""
-        display_frame = frame.copy()
+    def _draw_mode_selection_chrome(display_frame):
+        """Header and the two mode option panels"""
         height, width = display_frame.shape[:2]
         
         # Draw header
@@ -252,11 +356,11 @@ class SurveillanceGUI:
         cv2.circle(display_frame, (single_x + panel_width // 2, icon_y), 30, 
                   SurveillanceGUI.COLORS['success'], 3)
         cv2.putText(display_frame, "1", (single_x + panel_width // 2 - 10, icon_y + 15),
-                   cv2.FONT_HERSHEY_BOLD, 1.5, SurveillanceGUI.COLORS['success'], 3)
+                   _BOLD_FONT, 1.5, SurveillanceGUI.COLORS['success'], 3)
         
         cv2.putText(display_frame, "SINGLE OBJECT", 
                    (single_x + 70, y + 130),
-                   cv2.FONT_HERSHEY_BOLD, 0.8, SurveillanceGUI.COLORS['white'], 2, cv2.LINE_AA)
+                   _BOLD_FONT, 0.8, SurveillanceGUI.COLORS['white'], 2, cv2.LINE_AA)
         cv2.putText(display_frame, "Monitor one object", 
                    (single_x + 75, y + 160),
                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, SurveillanceGUI.COLORS['light'], 1, cv2.LINE_AA)
@@ -266,7 +370,7 @@ class SurveillanceGUI:
                      (single_x + 210, y + panel_height - 10),
                      SurveillanceGUI.COLORS['success'], -1)
         cv2.putText(display_frame, "Press 'S'", (single_x + 150, y + panel_height - 18),
-                   cv2.FONT_HERSHEY_BOLD, 0.6, SurveillanceGUI.COLORS['white'], 2)
+                   _BOLD_FONT, 0.6, SurveillanceGUI.COLORS['white'], 2)
         
         # Multiple ROI Panel
         multi_x = start_x + panel_width + gap
@@ -283,7 +387,7 @@ class SurveillanceGUI:
         
         cv2.putText(display_frame, "MULTIPLE OBJECTS", 
                    (multi_x + 50, y + 130),
-                   cv2.FONT_HERSHEY_BOLD, 0.8, SurveillanceGUI.COLORS['white'], 2, cv2.LINE_AA)
+                   _BOLD_FONT, 0.8, SurveillanceGUI.COLORS['white'], 2, cv2.LINE_AA)
         cv2.putText(display_frame, "Monitor 2+ objects", 
                    (multi_x + 75, y + 160),
                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, SurveillanceGUI.COLORS['light'], 1, cv2.LINE_AA)
@@ -293,15 +397,19 @@ class SurveillanceGUI:
                      (multi_x + 210, y + panel_height - 10),
                      SurveillanceGUI.COLORS['info'], -1)
         cv2.putText(display_frame, "Press 'M'", (multi_x + 148, y + panel_height - 18),
-                   cv2.FONT_HERSHEY_BOLD, 0.6, SurveillanceGUI.COLORS['white'], 2)
-        
+                   _BOLD_FONT, 0.6, SurveillanceGUI.COLORS['white'], 2)
+    
+    @staticmethod
+    def draw_roi_selection_gui(frame, roi_count=1, is_multiple=False, inplace=False):
+        """Draw GUI for ROI selection (inplace=True draws on frame itself, skipping the copy)"""
+        display_frame = frame if inplace else frame.copy()
+        SurveillanceGUI._composite_chrome(display_frame, ('roi_selection', display_frame.shape, roi_count, is_multiple),
+                                          lambda img: SurveillanceGUI._draw_roi_selection_chrome(img, roi_count, is_multiple))
         return display_frame
     
     @staticmethod
-    def draw_roi_selection_gui(frame, roi_count=1, is_multiple=False):
-        """Draw GUI for ROI selection"""
-        display_frame = frame.copy()
-        
+    def _draw_roi_selection_chrome(display_frame, roi_count, is_multiple):
+        """Header, instructions and footer for ROI selection"""
         # Draw header
         if is_multiple:
             title = f"DRAW ROI #{roi_count}"
@@ -338,13 +446,11 @@ class SurveillanceGUI:
                 ('c', 'Cancel', 'warning')
             ]
         SurveillanceGUI.draw_footer_controls(display_frame, controls)
-        
-        return display_frame
     
     @staticmethod
-    def draw_tracking_status(frame, roi_targets, any_alert=False):
-        """Draw tracking status overlay during monitoring"""
-        display_frame = frame.copy()
+    def draw_tracking_status(frame, roi_targets, any_alert=False, inplace=False):
+        """Draw tracking status overlay during monitoring (inplace=True draws on frame itself, skipping the copy)"""
+        display_frame = frame if inplace else frame.copy()
         height, width = display_frame.shape[:2]
         
         # Draw compact status panel at top
@@ -360,38 +466,42 @@ class SurveillanceGUI:
             status_text = "✓ All Secured"
             status_color = SurveillanceGUI.COLORS['success']
         
-        cv2.putText(display_frame, status_text, (30, 40),
-                   cv2.FONT_HERSHEY_BOLD, 1.0, status_color, 2, cv2.LINE_AA)
+        # These strings repeat every frame, so draw them from cached sprites
+        SurveillanceGUI.draw_cached_text(display_frame, status_text, (30, 40),
+                                         _BOLD_FONT, 1.0, status_color, 2)
         
         # Mode indicator
-        cv2.putText(display_frame, "METHOD 2: Tracker Mode", (30, 70),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, SurveillanceGUI.COLORS['light'], 1, cv2.LINE_AA)
+        SurveillanceGUI.draw_cached_text(display_frame, "METHOD 2: Tracker Mode", (30, 70),
+                                         cv2.FONT_HERSHEY_SIMPLEX, 0.6, SurveillanceGUI.COLORS['light'], 1)
         
         # Object count
         count_text = f"Tracking: {len(roi_targets)} object(s)"
-        text_width = cv2.getTextSize(count_text, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 1)[0][0]
-        cv2.putText(display_frame, count_text, (width - text_width - 30, 40),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, SurveillanceGUI.COLORS['primary'], 2, cv2.LINE_AA)
+        text_width = _text_size(count_text, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 1)[0][0]
+        SurveillanceGUI.draw_cached_text(display_frame, count_text, (width - text_width - 30, 40),
+                                         cv2.FONT_HERSHEY_SIMPLEX, 0.6, SurveillanceGUI.COLORS['primary'], 2)
         
-        # Draw footer controls
-        controls = [
+        # Draw footer controls (static, so composited from a cached overlay)
+        controls = (
             ('r', 'Re-select ROI', 'warning'),
             ('q', 'Quit', 'danger')
-        ]
-        SurveillanceGUI.draw_footer_controls(display_frame, controls)
+        )
+        SurveillanceGUI._composite_chrome(display_frame, ('tracking_footer', display_frame.shape),
+                                          lambda img: SurveillanceGUI.draw_footer_controls(img, controls))
         
         return display_frame
     
     @staticmethod
-    def draw_initialization_message(frame, message):
-        """Draw initialization/loading message"""
-        display_frame = frame.copy()
+    def draw_initialization_message(frame, message, inplace=False):
+        """Draw initialization/loading message (inplace=True draws on frame itself, skipping the copy)"""
+        display_frame = frame if inplace else frame.copy()
         height, width = display_frame.shape[:2]
         
-        # Draw semi-transparent overlay
-        overlay = display_frame.copy()
-        cv2.rectangle(overlay, (0, 0), (width, height), SurveillanceGUI.COLORS['dark'], -1)
-        cv2.addWeighted(overlay, 0.7, display_frame, 0.3, 0, display_frame)
+        # Draw semi-transparent overlay (blended in place against a cached solid backdrop)
+        backdrop = SurveillanceGUI._dim_backdrops.get(display_frame.shape)
+        if backdrop is None:
+            backdrop = np.full(display_frame.shape, SurveillanceGUI.COLORS['dark'], dtype=np.uint8)
+            SurveillanceGUI._dim_backdrops[display_frame.shape] = backdrop
+        cv2.addWeighted(backdrop, 0.7, display_frame, 0.3, 0, display_frame)
         
         # Draw message box
         box_width = 500
@@ -408,7 +518,7 @@ class SurveillanceGUI:
         
         # Draw message
         cv2.putText(display_frame, message + dots, (x + 50, y + 70),
-                   cv2.FONT_HERSHEY_BOLD, 0.9, SurveillanceGUI.COLORS['white'], 2, cv2.LINE_AA)
+                   _BOLD_FONT, 0.9, SurveillanceGUI.COLORS['white'], 2, cv2.LINE_AA)
         
         cv2.putText(display_frame, "Please wait...", (x + 180, y + 110),
                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, SurveillanceGUI.COLORS['light'], 1, cv2.LINE_AA)